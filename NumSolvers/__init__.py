@@ -4,11 +4,28 @@ This module provides numerical solvers for differential equations.
 
 from .fwdeul import *
 from .modeul import *
+from .impeul import *
+from .blockeul import *
 from .rk2 import *
 from .rk4 import *
+from .rk45 import *
+from .ivp import *
 
 from .method import Method
 
+_METHODS = {
+    "FwdEuler": FwdEuler,
+    "ModEuler": ModEuler,
+    "ImplicitEuler": ImplicitEuler,
+    "BlockBackwardEuler": BlockBackwardEuler,
+    "RK2": RK2,
+    "RK4": RK4,
+    "RK45": RK45,
+    "BDF": BDF,
+    "LSODA": LSODA,
+    "NumbaLSODA": NumbaLSODA,
+}
+
 
 def get_method(name: str, **kwargs) -> Method:
     """
@@ -17,15 +34,20 @@ def get_method(name: str, **kwargs) -> Method:
     Args:
         name (str): The name of the numerical method to retrieve. Options are:
             - 'FwdEuler': Requires kwargs 'tmin', 'tmax', and 'h'.
-            - 'ModEuler': Requires kwargs 'tmin', 'tmax', 'h', and 'eps'.
+            - 'ModEuler': Requires kwargs 'tmin', 'tmax', 'h', and 'eps'. Accepts 'jac'.
+            - 'ImplicitEuler': Requires kwargs 'tmin', 'tmax', 'h', and 'eps'. Accepts 'jac' and 'maxiter'.
+            - 'BlockBackwardEuler': Requires kwargs 'tmin', 'tmax', 'h', and 'eps'. Accepts 'jac' and 'chunk'. Requires scipy.
             - 'RK2': Requires kwargs 'tmin', 'tmax', and 'h'.
             - 'RK4': Requires kwargs 'tmin', 'tmax', and 'h'.
+            - 'RK45': Requires kwargs 'tmin', 'tmax', and 'h'. Accepts 'rtol', 'atol' and 'max_step'.
+            - 'BDF': Requires kwargs 'tmin', 'tmax', and 'h'. Accepts 'jac', 'rtol' and 'atol'. Requires scipy.
+            - 'LSODA': Requires kwargs 'tmin', 'tmax', and 'h'. Accepts 'jac', 'rtol' and 'atol'. Requires scipy.
+            - 'NumbaLSODA': As 'LSODA'; population models with `rhs` run it through numbalsoda when installed.
         **kwargs: Additional keyword arguments to pass to the method constructor.
 
     Returns:
         Method: An instance of the requested numerical method.
     """
-    options = ['FwdEuler', 'ModEuler', 'RK2', 'RK4']
-    if name not in options:
-        raise ValueError(f"Method '{name}' is not recognized. Available options are: {options}")
-    return eval(name)(**kwargs)
+    if name not in _METHODS:
+        raise ValueError(f"Method '{name}' is not recognized. Available options are: {list(_METHODS)}")
+    return _METHODS[name](**kwargs)
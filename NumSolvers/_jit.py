@@ -0,0 +1,56 @@
+"""
+This module provides optional Numba support for the numerical solvers.
+
+When Numba is not installed, `njit` degrades to a no-op decorator so that
+kernels remain importable and run as plain Python.
+"""
+
+from typing import Callable
+
+try:
+    from numba import njit
+    from numba.extending import is_jitted as _is_jitted
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for `numba.njit` that returns the decorated function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    def _is_jitted(f: Callable) -> bool:
+        return False
+
+
+def is_jitted(f: Callable) -> bool:
+    """
+    Check whether a function has been compiled with one of Numba's jit decorators.
+
+    Args:
+        f (Callable): The function to check.
+
+    Returns:
+        bool: True if `f` can be called from inside an `njit` kernel.
+    """
+    return NUMBA_AVAILABLE and _is_jitted(f)
+
+
+def cuda_available() -> bool:
+    """
+    Check whether Numba can compile and launch CUDA kernels on this machine.
+
+    Returns:
+        bool: True if Numba's CUDA target is installed and a GPU is detected.
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    try:
+        from numba import cuda
+    except ImportError:
+        return False
+    return cuda.is_available()
@@ -0,0 +1,174 @@
+"""
+This module contains an implementation of the implicit (backward) Euler method that
+solves a block of consecutive time steps at once, for solving ordinary differential
+equations (ODEs).
+"""
+
+import numpy as np
+from tqdm import tqdm
+from typing import Union, Callable, List, Optional
+
+try:
+    from scipy.linalg import solve_banded
+except ImportError:
+    solve_banded = None
+
+from .method import Method
+
+
+class BlockBackwardEuler(Method):
+    """
+    Backward Euler method that advances `chunk` steps per Newton solve.
+
+    The backward Euler equations y_j - y_{j-1} - h * f(y_j, t_j) = 0 for a chunk of K
+    steps form a block-bidiagonal system. Each Newton update for the whole chunk is a
+    single banded LAPACK solve instead of K separate ones. Right-hand sides that read
+    earlier states back from `res` (such as `Delay`) should use a chunk no longer than
+    their lag, since that coupling is not part of the Jacobian.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        eps: float = 1e-10,
+        jac: Optional[Callable] = None,
+        chunk: int = 64,
+        maxiter: int = 50,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the BlockBackwardEuler solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition. Batched initial conditions
+                are not supported.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The step size. Defaults to 1e-2.
+            eps (float, optional): The tolerance for convergence. Defaults to 1e-10.
+            jac (Optional[Callable], optional): The Jacobian of `f`. When omitted it is
+                approximated by finite differences. Defaults to None.
+            chunk (int, optional): The number of time steps solved together. Defaults to 64.
+            maxiter (int, optional): The maximum number of Newton iterations per chunk. Defaults to 50.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
+        """
+        if solve_banded is None:
+            raise ImportError("BlockBackwardEuler requires scipy to be installed.")
+        super().__init__(f, f0, tmin, tmax, h, jac, verbose)
+        if self.res.ndim != 2:
+            raise ValueError("BlockBackwardEuler does not support batched initial conditions.")
+        self.eps = eps
+        self.chunk = chunk
+        self.maxiter = maxiter
+
+    def _jacobian(self, y: np.ndarray, t: float, fy: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the Jacobian of `f`, falling back to forward differences.
+
+        Args:
+            y (np.ndarray): The state at which to evaluate the Jacobian.
+            t (float): The time at which to evaluate the Jacobian.
+            fy (np.ndarray): The value of f(y, t).
+
+        Returns:
+            np.ndarray: The (d, d) Jacobian matrix.
+        """
+        if self.jac is not None:
+            return self.jac(y, t)
+
+        d = y.size
+        J = np.empty((d, d))
+        for k in range(d):
+            dk = 1e-8 * max(1.0, abs(y[k]))
+            yk = y.copy()
+            yk[k] += dk
+            J[:, k] = (self.f(yk, t) - fy) / dk
+        return J
+
+    def solve(self):
+        """
+        Solve the differential equation using the block backward Euler method.
+
+        Returns:
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
+        """
+        f = self.f
+        h = self.h
+        res, ts = self.res, self.range
+        d = res.shape[0]
+        eye = np.eye(d)
+
+        for start in self._chunks():
+            stop = min(start + self.chunk, self.n)
+            K = stop - start
+            window = res[:, start:stop]
+
+            # Forward Euler predictor for the whole chunk.
+            for j in range(K):
+                self.step = start + j - 1
+                prev = res[:, start + j - 1]
+                window[:, j] = prev + h * f(prev, ts[start + j - 1])
+
+            # Banded storage of the (K*d, K*d) Newton matrix: d sub-diagonals, d-1 super-diagonals.
+            ab = np.zeros((2 * d, K * d))
+            ab[2 * d - 1, : (K - 1) * d] = -1.0
+            F = np.empty((K, d))
+            M = np.empty((K, d, d))
+            for _ in range(self.maxiter):
+                for j in range(K):
+                    self.step = start + j
+                    y = window[:, j]
+                    F[j] = f(y, ts[start + j])
+                    M[j] = eye - h * self._jacobian(y, ts[start + j], F[j])
+
+                for a in range(d):
+                    for b in range(d):
+                        ab[d - 1 + a - b, b::d] = M[:, a, b]
+
+                Y = window.T
+                G = Y - h * F
+                G[0] -= res[:, start - 1]
+                G[1:] -= Y[:-1]
+
+                dY = solve_banded((d, d - 1), ab, G.ravel()).reshape(K, d)
+                window -= dY.T
+                if np.max(np.abs(dY)) <= self.eps:
+                    break
+            else:
+                raise RuntimeError(
+                    f"BlockBackwardEuler did not converge within {self.maxiter} Newton iterations "
+                    f"for the chunk starting at t = {ts[start]}."
+                )
+
+        return res
+
+    def _chunks(self):
+        """
+        Iterate over the first step index of each chunk.
+
+        Returns:
+            Iterable[int]: range(1, n, chunk), wrapped in a progress bar when `verbose` is set.
+        """
+        starts = range(1, self.n, self.chunk)
+        return tqdm(starts) if self.verbose else starts
+
+
+if __name__ == "__main__":
+    # Example: Solve the stiff differential equation dy/dt = -50 y with initial condition y(0) = 1
+    from matplotlib import pyplot as plt
+
+    f = lambda y, t: -50 * y
+    y0 = 1
+    t0, t1 = 0, 1
+
+    solver = BlockBackwardEuler(f, y0, t0, t1, h=0.05)
+    res = solver.solve()
+
+    plt.plot(solver.range, res[0])
+    plt.plot(solver.range, np.exp(-50 * solver.range))
+    plt.show()
@@ -4,7 +4,6 @@ for solving ordinary differential equations (ODEs).
 """
 
 import numpy as np
-from tqdm import tqdm
 from typing import Union, Callable, List
 
 
@@ -22,6 +21,7 @@ class FwdEuler(Method):
         tmin: float,
         tmax: float,
         h: float = 1e-2,
+        verbose: bool = False,
     ):
         """
         Initialize the FwdEuler solver.
@@ -32,23 +32,29 @@ class FwdEuler(Method):
             tmin (float): The start time.
             tmax (float): The end time.
             h (float, optional): The step size. Defaults to 1e-2.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
         """
-        super().__init__(f, f0, tmin, tmax, h)
+        super().__init__(f, f0, tmin, tmax, h, verbose=verbose)
 
     def solve(self):
         """
         Solve the differential equation using the forward Euler method.
 
         Returns:
-            list: The solution of the differential equation at each time step.
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
         """
         f = self.f
         h = self.h
+        res, ts = self.res, self.range
 
-        for i in tqdm(self.range[1:]):
-            self.res.append(self.res[-1] + h * f(self.res[-1], i - h))
+        for idx in self._steps():
+            self.step = idx - 1
+            t_prev = ts[idx] - h
+            y = res[..., idx - 1]
+            res[..., idx] = y + h * f(y, t_prev)
 
-        return self.res
+        return res
 
 
 if __name__ == "__main__":
@@ -63,7 +69,7 @@ if __name__ == "__main__":
     res = rk4.solve()
 
     # print(res)
-    plt.plot(rk4.range, res)
+    plt.plot(rk4.range, res[0])
     plt.plot(rk4.range, np.e**rk4.range)
     plt.show()
 
@@ -76,9 +82,8 @@ if __name__ == "__main__":
     rk4 = FwdEuler(f, u0, t0, t1)
     res = rk4.solve()
 
-    res = np.array(res)
-    plt.plot(rk4.range, res[:, 0], label="x(t)")
-    plt.plot(rk4.range, res[:, 1], label="y(t)")
+    plt.plot(rk4.range, res[0], label="x(t)")
+    plt.plot(rk4.range, res[1], label="y(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.cos(rk4.range), "--", label="True x(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.sin(rk4.range), "--", label="True y(t)")
     plt.legend()
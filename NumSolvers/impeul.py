@@ -0,0 +1,124 @@
+"""
+This module contains an implementation of the implicit (backward) Euler method
+for solving ordinary differential equations (ODEs).
+"""
+
+import numpy as np
+from typing import Union, Callable, List, Optional
+
+from .method import Method
+
+
+class ImplicitEuler(Method):
+    """
+    Implicit (backward) Euler method for solving ODEs.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        eps: float = 1e-10,
+        jac: Optional[Callable] = None,
+        maxiter: int = 50,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the ImplicitEuler solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The step size. Defaults to 1e-2.
+            eps (float, optional): The tolerance for convergence. Defaults to 1e-10.
+            jac (Optional[Callable], optional): The Jacobian of `f`. When given, each step is
+                solved with Newton's method instead of fixed-point iteration. Defaults to None.
+            maxiter (int, optional): The maximum number of iterations per step. Defaults to 50.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
+        """
+        super().__init__(f, f0, tmin, tmax, h, jac, verbose)
+        self.eps = eps
+        self.maxiter = maxiter
+
+    def solve(self):
+        """
+        Solve the differential equation using the implicit Euler method.
+
+        Each step solves y = prev + h * f(y, t) for y, starting from a forward Euler guess.
+
+        Returns:
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
+        """
+        f = self.f
+        jac = self.jac
+        h = self.h
+        res, ts = self.res, self.range
+        err = self._err
+        use_newton = jac is not None and res.ndim == 2
+        if use_newton:
+            eye = np.eye(res.shape[0])
+
+        for idx in self._steps():
+            t = ts[idx]
+            prev = res[..., idx - 1]
+            self.step = idx - 1
+            y = prev + h * f(prev, t - h)
+            self.step = idx
+            if use_newton:
+                for _ in range(self.maxiter):
+                    g = y - prev - h * f(y, t)
+                    dy = np.linalg.solve(eye - h * jac(y, t), g)
+                    y = y - dy
+                    if np.abs(dy, out=dy).max() <= self.eps:
+                        break
+                else:
+                    self._not_converged(t)
+            else:
+                temp = prev + h * f(y, t)
+                for _ in range(self.maxiter):
+                    if np.abs(np.subtract(y, temp, out=err), out=err).max() <= self.eps:
+                        break
+                    y = temp
+                    temp = prev + h * f(y, t)
+                else:
+                    self._not_converged(t)
+                y = temp
+
+            res[..., idx] = y
+
+        return res
+
+    def _not_converged(self, t: float):
+        """
+        Raise the error for a step whose iteration did not converge.
+
+        Args:
+            t (float): The time of the step.
+        """
+        kind = "Newton" if self.jac is not None and self.res.ndim == 2 else "fixed-point"
+        raise RuntimeError(
+            f"ImplicitEuler did not converge within {self.maxiter} {kind} iterations for the step at t = {t}. "
+            "A smaller step or an analytic Jacobian may help."
+        )
+
+
+if __name__ == "__main__":
+    # Example: Solve the stiff differential equation dy/dt = -50 y with initial condition y(0) = 1
+    from matplotlib import pyplot as plt
+
+    f = lambda y, t: -50 * y
+    jac = lambda y, t: np.array([[-50.0]])
+    y0 = 1
+    t0, t1 = 0, 1
+
+    solver = ImplicitEuler(f, y0, t0, t1, h=0.05, jac=jac)
+    res = solver.solve()
+
+    plt.plot(solver.range, res[0])
+    plt.plot(solver.range, np.exp(-50 * solver.range))
+    plt.show()
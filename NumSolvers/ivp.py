@@ -0,0 +1,192 @@
+"""
+This module wraps SciPy's `solve_ivp` integrators as methods for solving ordinary
+differential equations (ODEs).
+"""
+
+import numpy as np
+from typing import Union, Callable, List, Optional
+
+try:
+    from scipy.integrate import solve_ivp
+except ImportError:
+    solve_ivp = None
+
+from .method import Method
+
+
+class SolveIVP(Method):
+    """
+    Solves ODEs with one of `scipy.integrate.solve_ivp`'s integrators.
+
+    The integrator chooses its own steps, and the solution is sampled on `self.range`
+    through `t_eval`, so the result has the same layout as the fixed-step methods. `res` is
+    only filled once the integration finishes, so right-hand sides that read earlier states
+    back from it (such as `Delay`) are not supported.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        jac: Optional[Callable] = None,
+        scheme: str = "BDF",
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the SolveIVP solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition. Batched initial conditions
+                are not supported.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The spacing of the output grid. Defaults to 1e-2.
+            jac (Optional[Callable], optional): The Jacobian of `f`, used by the implicit schemes.
+                When omitted SciPy approximates it by finite differences. Defaults to None.
+            scheme (str, optional): The `solve_ivp` method, e.g. "BDF", "Radau" or "LSODA". Defaults to "BDF".
+            rtol (float, optional): The relative tolerance. Defaults to 1e-6.
+            atol (float, optional): The absolute tolerance. Defaults to 1e-9.
+            verbose (bool, optional): Unused; SciPy's integrators have no progress bar. Defaults to False.
+        """
+        if solve_ivp is None:
+            raise ImportError(f"{type(self).__name__} requires scipy to be installed.")
+        super().__init__(f, f0, tmin, tmax, h, jac, verbose)
+        if self.res.ndim != 2:
+            raise ValueError(f"{type(self).__name__} does not support batched initial conditions.")
+        self.scheme = scheme
+        self.rtol = rtol
+        self.atol = atol
+
+    def solve(self):
+        """
+        Solve the differential equation with `scipy.integrate.solve_ivp`.
+
+        Returns:
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
+        """
+        f = self.f
+        jac = self.jac
+        res, ts = self.res, self.range
+        if ts.size == 1:
+            # Nothing to integrate; SciPy rejects an empty time span.
+            return res
+
+        # f and jac may hand back reused buffers, which SciPy's integrators would keep.
+        fun = lambda t, y: np.array(f(y, t), dtype=np.float64)
+        jacobian = None if jac is None else (lambda t, y: np.array(jac(y, t), dtype=np.float64))
+
+        sol = solve_ivp(
+            fun,
+            (ts[0], ts[-1]),
+            res[:, 0],
+            method=self.scheme,
+            t_eval=ts,
+            jac=jacobian,
+            rtol=self.rtol,
+            atol=self.atol,
+        )
+        if not sol.success:
+            raise RuntimeError(f"{type(self).__name__} failed: {sol.message}")
+
+        res[:] = sol.y
+        return res
+
+
+class BDF(SolveIVP):
+    """
+    Variable-order backward differentiation formula (BDF) method for stiff ODEs.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        jac: Optional[Callable] = None,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the BDF solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The spacing of the output grid. Defaults to 1e-2.
+            jac (Optional[Callable], optional): The Jacobian of `f`. Defaults to None.
+            rtol (float, optional): The relative tolerance. Defaults to 1e-6.
+            atol (float, optional): The absolute tolerance. Defaults to 1e-9.
+            verbose (bool, optional): Unused. Defaults to False.
+        """
+        super().__init__(f, f0, tmin, tmax, h, jac, "BDF", rtol, atol, verbose)
+
+
+class LSODA(SolveIVP):
+    """
+    LSODA method, which switches between Adams (non-stiff) and BDF (stiff) formulas as needed.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        jac: Optional[Callable] = None,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the LSODA solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The spacing of the output grid. Defaults to 1e-2.
+            jac (Optional[Callable], optional): The Jacobian of `f`, used in the stiff phases. Defaults to None.
+            rtol (float, optional): The relative tolerance. Defaults to 1e-6.
+            atol (float, optional): The absolute tolerance. Defaults to 1e-9.
+            verbose (bool, optional): Unused. Defaults to False.
+        """
+        super().__init__(f, f0, tmin, tmax, h, jac, "LSODA", rtol, atol, verbose)
+
+
+class NumbaLSODA(LSODA):
+    """
+    LSODA that population models may run entirely in compiled code.
+
+    On its own it behaves exactly like `LSODA`. Population models that define `rhs` hand
+    it to `numbalsoda` as a compiled callback instead, when `numbalsoda` is installed;
+    that path uses LSODA's own finite-difference Jacobian, so `jac` only applies to the
+    SciPy fallback.
+    """
+
+
+if __name__ == "__main__":
+    # Example: Solve the stiff differential equation dy/dt = -50 y with initial condition y(0) = 1
+    from matplotlib import pyplot as plt
+
+    f = lambda y, t: -50 * y
+    jac = lambda y, t: np.array([[-50.0]])
+    y0 = 1
+    t0, t1 = 0, 1
+
+    solver = BDF(f, y0, t0, t1, h=0.05, jac=jac)
+    res = solver.solve()
+
+    plt.plot(solver.range, res[0])
+    plt.plot(solver.range, np.exp(-50 * solver.range))
+    plt.show()
@@ -3,7 +3,8 @@ This module contains the base class structure for an ODE solving method.
 """
 
 import numpy as np
-from typing import Union, Callable, List
+from tqdm import tqdm
+from typing import Union, Callable, List, Optional
 
 
 class Method:
@@ -17,37 +18,74 @@ class Method:
         tmin: float,
         tmax: float,
         h: float = 1e-2,
+        jac: Optional[Callable] = None,
+        verbose: bool = False,
     ):
         """
         Initialize the Method solver.
 
         Args:
-            f (Callable): The function to be solved.
-            f0 (Union[float, np.ndarray]): The initial condition.
+            f (Callable): The function to be solved, called as `f(x, t)`. It may return the same
+                preallocated buffer on every call, so solvers must copy or consume its result
+                before calling it again.
+            f0 (Union[float, np.ndarray]): The initial condition. An array of shape (d, B)
+                integrates B independent initial conditions of a d-dimensional system at once.
             tmin (float): The start time.
             tmax (float): The end time.
             h (float, optional): The step size. Defaults to 1e-2.
+            jac (Optional[Callable], optional): The Jacobian of `f` with respect to the state,
+                called as `jac(x, t)`. Methods that can exploit it do so. Defaults to None.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
         """
 
-        if isinstance(f0, (int, float)):
-            f0 = np.array([f0])
-        elif isinstance(f0, list):
-            f0 = np.array(f0)
+        # No-op for a float64 ndarray, e.g. one already converted by PopModel.
+        f0 = np.atleast_1d(np.asarray(f0, dtype=np.float64))
 
         self.f = f
+        self.jac = jac
         self.h = h
+        self.verbose = verbose
         self.f0 = f0
-        
-        self.res = [f0]
 
         self.tmin, self.tmax = tmin, tmax
-        self.range = np.arange(tmin, tmax, h)
+        # Built from a whole number of steps: np.arange with a float step can gain or lose a point.
+        # At least one point, so a span shorter than half a step still returns the initial condition.
+        self.n = max(int(round((tmax - tmin) / h)), 1)
+        self.range = np.linspace(tmin, tmin + self.n * h, self.n, endpoint=False)
+        # Index into self.range of the time f is being evaluated at, kept current by the solvers.
+        self.step = 0
+
+        # Results are stored state-major, so each compartment's trajectory res[j] is contiguous.
+        self.res = np.empty(np.shape(f0) + (self.n,))
+        self.res[..., 0] = f0
+        # Scratch space for the convergence checks of the iterative methods.
+        self._err = np.empty(np.shape(f0))
+
+    def _steps(self):
+        """
+        Iterate over the indices of the time steps to compute.
+
+        Returns:
+            Iterable[int]: range(1, n), wrapped in a progress bar when `verbose` is set.
+        """
+        steps = range(1, self.n)
+        return tqdm(steps) if self.verbose else steps
+
+    def _new_result(self):
+        """
+        Replace `res` with a fresh buffer holding only the initial condition, so that a
+        result handed out by an earlier `solve` is not overwritten by the next one.
+        """
+        res = np.empty_like(self.res)
+        res[..., 0] = self.res[..., 0]
+        self.res = res
 
     def solve(self):
         """
         Solve the ODE using the specified method.
 
         Returns:
-            np.ndarray: The solution array.
+            np.ndarray: The solution array. Solvers return their own `res` buffer, which a
+                later `solve` overwrites; copy it, or call `_new_result` first, to keep it.
         """
         return np.zeros_like(self.range)
@@ -4,10 +4,29 @@ for solving ordinary differential equations (ODEs).
 """
 
 import numpy as np
-from tqdm import tqdm
-from typing import Union, Callable, List
+from typing import Union, Callable, List, Optional
 
 from .method import Method
+from ._jit import njit, is_jitted
+
+
+@njit
+def _modeul_kernel(f, y0, ts, h, eps, out):
+    """
+    Compiled modified Euler step loop used when `f` is itself a Numba-jitted function.
+    """
+    half_h = 0.5 * h
+    out[..., 0] = y0
+    for i in range(1, ts.size):
+        t = ts[i]
+        prev = out[..., i - 1]
+        base = prev + half_h * f(prev, t - h)
+        y = prev + h * f(prev, t)
+        temp = base + half_h * f(y, t)
+        while np.max(np.abs(y - temp)) > eps:
+            y = temp
+            temp = base + half_h * f(y, t)
+        out[..., i] = y
 
 
 class ModEuler(Method):
@@ -22,6 +41,8 @@ class ModEuler(Method):
         tmax: float,
         h: float = 1e-2,
         eps: float = 1e-10,
+        jac: Optional[Callable] = None,
+        verbose: bool = False,
     ):
         """
         Initialize the ModEuler solver.
@@ -33,8 +54,11 @@ class ModEuler(Method):
             tmax (float): The end time.
             h (float, optional): The step size. Defaults to 1e-2.
             eps (float, optional): The tolerance for convergence. Defaults to 1e-10.
+            jac (Optional[Callable], optional): The Jacobian of `f`. When given, each step is
+                solved with Newton's method instead of fixed-point iteration. Defaults to None.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
         """
-        super().__init__(f, f0, tmin, tmax, h)
+        super().__init__(f, f0, tmin, tmax, h, jac, verbose)
         self.eps = eps
 
     def solve(self):
@@ -42,21 +66,74 @@ class ModEuler(Method):
         Solve the differential equation using the modified Euler method.
 
         Returns:
-            list: The solution of the differential equation at each time step.
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
         """
         f = self.f
         h = self.h
 
-        for i in tqdm(self.range[1:]):
-            y = self.res[-1] + h * f(self.res[-1], i)
-            temp = self.res[-1] + (h / 2) * (f(self.res[-1], i - h) + f(y, i))
-            while np.mean(y - temp) > self.eps:
+        if self.jac is not None and self.res.ndim == 2:
+            return self._solve_newton()
+
+        if is_jitted(f):
+            _modeul_kernel(f, self.res[..., 0], self.range, h, self.eps, self.res)
+            return self.res
+
+        half_h = 0.5 * h
+        res, ts = self.res, self.range
+        err = self._err
+
+        for idx in self._steps():
+            t = ts[idx]
+            prev = res[..., idx - 1]
+            # f may hand back a reused buffer, so fold f(prev) in before calling f(y).
+            self.step = idx - 1
+            base = prev + half_h * f(prev, t - h)
+            self.step = idx
+            y = prev + h * f(prev, t)
+            temp = base + half_h * f(y, t)
+            while np.abs(np.subtract(y, temp, out=err), out=err).max() > self.eps:
                 y = temp
-                temp = self.res[-1] + (h / 2) * (f(self.res[-1], i - h) + f(y, i))
+                temp = base + half_h * f(y, t)
+
+            res[..., idx] = y
+
+        return res
+
+    def _solve_newton(self):
+        """
+        Solve the implicit trapezoidal step with Newton's method using `self.jac`.
+
+        The corrector equation y = prev + h/2 * (f(prev) + f(y)) is solved as
+        (I - h/2 * J) dy = g(y). For a linear `f` this converges in a single update.
+
+        Returns:
+            np.ndarray: The solution of the differential equation at each time step.
+        """
+        f = self.f
+        jac = self.jac
+        h = self.h
+        half_h = 0.5 * h
+        res, ts = self.res, self.range
+        eye = np.eye(res.shape[0])
+
+        for idx in self._steps():
+            t = ts[idx]
+            prev = res[..., idx - 1]
+            self.step = idx - 1
+            base = prev + half_h * f(prev, t - h)
+            self.step = idx
+            y = prev + h * f(prev, t)
+            while True:
+                g = y - base - half_h * f(y, t)
+                dy = np.linalg.solve(eye - half_h * jac(y, t), g)
+                y = y - dy
+                if np.abs(dy, out=dy).max() <= self.eps:
+                    break
 
-            self.res.append(y)
+            res[..., idx] = y
 
-        return self.res
+        return res
 
 
 if __name__ == "__main__":
@@ -71,7 +148,7 @@ if __name__ == "__main__":
     res = rk4.solve()
 
     # print(self.res)
-    plt.plot(rk4.range, res)
+    plt.plot(rk4.range, res[0])
     plt.plot(rk4.range, np.e**rk4.range)
     plt.show()
 
@@ -84,9 +161,8 @@ if __name__ == "__main__":
     rk4 = ModEuler(f, u0, t0, t1)
     res = rk4.solve()
 
-    res = np.array(res)
-    plt.plot(rk4.range, res[:, 0], label="x(t)")
-    plt.plot(rk4.range, res[:, 1], label="y(t)")
+    plt.plot(rk4.range, res[0], label="x(t)")
+    plt.plot(rk4.range, res[1], label="y(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.cos(rk4.range), "--", label="True x(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.sin(rk4.range), "--", label="True y(t)")
     plt.legend()
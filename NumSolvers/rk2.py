@@ -4,10 +4,24 @@ for solving ordinary differential equations (ODEs).
 """
 
 import numpy as np
-from tqdm import tqdm
 from typing import Union, Callable, List
 
 from .method import Method
+from ._jit import njit, is_jitted
+
+
+@njit
+def _rk2_kernel(f, y0, ts, h, out):
+    """
+    Compiled RK2 step loop used when `f` is itself a Numba-jitted function.
+    """
+    out[..., 0] = y0
+    for i in range(1, ts.size):
+        t_prev = ts[i] - h
+        y = out[..., i - 1]
+        k1 = h * f(y, t_prev)
+        k2 = h * f(y + h * k1, t_prev)
+        out[..., i] = y + 0.5 * (k1 + k2)
 
 
 class RK2(Method):
@@ -21,6 +35,7 @@ class RK2(Method):
         tmin: float,
         tmax: float,
         h: float = 1e-2,
+        verbose: bool = False,
     ):
         """
         Initialize the RK2 solver.
@@ -31,26 +46,37 @@ class RK2(Method):
             tmin (float): The start time.
             tmax (float): The end time.
             h (float, optional): The step size. Defaults to 1e-2.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
         """
-        super().__init__(f, f0, tmin, tmax, h)
+        super().__init__(f, f0, tmin, tmax, h, verbose=verbose)
 
     def solve(self):
         """
         Solve the differential equation using the RK2 method.
 
         Returns:
-            list: The solution of the differential equation at each time step.
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
         """
         f = self.f
         h = self.h
-        
-        for i in tqdm(self.range[1:]):
-            k1 = h * f(self.res[-1], i - h)
-            k2 = h * f(self.res[-1] + h * k1, i - h)
 
-            self.res.append(self.res[-1] + (k1 + k2) / 2)
+        if is_jitted(f):
+            _rk2_kernel(f, self.res[..., 0], self.range, h, self.res)
+            return self.res
+
+        res, ts = self.res, self.range
+
+        for idx in self._steps():
+            self.step = idx - 1
+            t_prev = ts[idx] - h
+            y = res[..., idx - 1]
+            k1 = h * f(y, t_prev)
+            k2 = h * f(y + h * k1, t_prev)
+
+            res[..., idx] = y + 0.5 * (k1 + k2)
 
-        return self.res
+        return res
 
 
 if __name__ == "__main__":
@@ -65,7 +91,7 @@ if __name__ == "__main__":
     res = rk4.solve()
 
     # print(res)
-    plt.plot(rk4.range, res)
+    plt.plot(rk4.range, res[0])
     plt.plot(rk4.range, np.e**rk4.range)
     plt.show()
 
@@ -78,9 +104,8 @@ if __name__ == "__main__":
     rk4 = RK2(f, u0, t0, t1)
     res = rk4.solve()
 
-    res = np.array(res)
-    plt.plot(rk4.range, res[:, 0], label="x(t)")
-    plt.plot(rk4.range, res[:, 1], label="y(t)")
+    plt.plot(rk4.range, res[0], label="x(t)")
+    plt.plot(rk4.range, res[1], label="y(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.cos(rk4.range), "--", label="True x(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.sin(rk4.range), "--", label="True y(t)")
     plt.legend()
@@ -4,7 +4,6 @@ for solving ordinary differential equations (ODEs).
 """
 
 import numpy as np
-from tqdm import tqdm
 from typing import Union, Callable, List
 
 from .method import Method
@@ -21,6 +20,7 @@ class RK4(Method):
         tmin: float,
         tmax: float,
         h: float = 1e-2,
+        verbose: bool = False,
     ):
         """
         Initialize the RK4 solver.
@@ -31,28 +31,35 @@ class RK4(Method):
             tmin (float): The start time.
             tmax (float): The end time.
             h (float, optional): The step size. Defaults to 1e-2.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
         """
-        super().__init__(f, f0, tmin, tmax, h)
+        super().__init__(f, f0, tmin, tmax, h, verbose=verbose)
 
     def solve(self):
         """
         Solve the differential equation using the RK4 method.
 
         Returns:
-            list: The solution of the differential equation at each time step.
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
         """
         f = self.f
         h = self.h
+        half_h = 0.5 * h
+        res, ts = self.res, self.range
 
-        for i in tqdm(self.range[1:]):
-            k1 = h * f(self.res[-1], i - h)
-            k2 = h * f(self.res[-1] + h * k1 / 2, i - h)
-            k3 = h * f(self.res[-1] + h * k2 / 2, i - h)
-            k4 = h * f(self.res[-1] + h * k3, i - h)
+        for idx in self._steps():
+            self.step = idx - 1
+            t_prev = ts[idx] - h
+            y = res[..., idx - 1]
+            k1 = h * f(y, t_prev)
+            k2 = h * f(y + half_h * k1, t_prev)
+            k3 = h * f(y + half_h * k2, t_prev)
+            k4 = h * f(y + h * k3, t_prev)
 
-            self.res.append(self.res[-1] + (k1 + 2 * k2 + 2 * k3 + k4) / 6)
+            res[..., idx] = y + (k1 + 2 * k2 + 2 * k3 + k4) / 6
 
-        return self.res
+        return res
 
 
 if __name__ == "__main__":
@@ -67,7 +74,7 @@ if __name__ == "__main__":
     res = rk4.solve()
 
     # print(res)
-    plt.plot(rk4.range, res)
+    plt.plot(rk4.range, res[0])
     plt.plot(rk4.range, np.e**rk4.range)
     plt.show()
 
@@ -80,9 +87,8 @@ if __name__ == "__main__":
     rk4 = RK4(f, u0, t0, t1)
     res = rk4.solve()
 
-    res = np.array(res)
-    plt.plot(rk4.range, res[:, 0], label="x(t)")
-    plt.plot(rk4.range, res[:, 1], label="y(t)")
+    plt.plot(rk4.range, res[0], label="x(t)")
+    plt.plot(rk4.range, res[1], label="y(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.cos(rk4.range), "--", label="True x(t)")
     plt.plot(rk4.range, np.exp(rk4.range) * np.sin(rk4.range), "--", label="True y(t)")
     plt.legend()
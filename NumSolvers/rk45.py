@@ -0,0 +1,159 @@
+"""
+This module contains an implementation of the adaptive Dormand-Prince method (RK45)
+for solving ordinary differential equations (ODEs).
+"""
+
+import numpy as np
+from tqdm import tqdm
+from typing import Union, Callable, List
+
+from .method import Method
+
+# Dormand-Prince 5(4) tableau.
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# Difference between the 5th and 4th order weights, used for the error estimate.
+_E = np.array([71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+
+class RK45(Method):
+    """
+    Adaptive Dormand-Prince method (RK45) for solving ODEs.
+
+    Internal steps are sized to keep the local error estimate within `rtol` and `atol`,
+    and the solution is interpolated onto the fixed grid `self.range` with cubic Hermite
+    interpolation, so the result has the same layout as the fixed-step methods.
+    """
+    def __init__(
+        self,
+        f: Callable,
+        f0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        tmin: float,
+        tmax: float,
+        h: float = 1e-2,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        max_step: float = np.inf,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the RK45 solver.
+
+        Args:
+            f (Callable): The function to be solved.
+            f0 (Union[float, np.ndarray]): The initial condition.
+            tmin (float): The start time.
+            tmax (float): The end time.
+            h (float, optional): The spacing of the output grid, also used as the first
+                internal step. Defaults to 1e-2.
+            rtol (float, optional): The relative tolerance of the local error. Defaults to 1e-6.
+            atol (float, optional): The absolute tolerance of the local error. Defaults to 1e-9.
+            max_step (float, optional): The largest internal step allowed. Right-hand sides that
+                read earlier states back from `res` (such as `Delay`) should keep it below their
+                lag. Defaults to np.inf.
+            verbose (bool, optional): Show a progress bar while solving. Defaults to False.
+        """
+        super().__init__(f, f0, tmin, tmax, h, verbose=verbose)
+        self.rtol = rtol
+        self.atol = atol
+        self.max_step = max_step
+        # The number of accepted internal steps taken by the last call to solve().
+        self.nsteps = 0
+
+    def solve(self):
+        """
+        Solve the differential equation using the RK45 method.
+
+        While a step is in progress `self.step` is the index of the last output already
+        written, so right-hand sides that look up earlier states only see computed values.
+
+        Returns:
+            np.ndarray: The solution of the differential equation at each time step,
+                with shape (len(f0), len(self.range)).
+        """
+        f = self.f
+        res, ts = self.res, self.range
+        t_end = ts[-1]
+        rtol, atol = self.rtol, self.atol
+
+        t = ts[0]
+        y = res[..., 0].copy()
+        K = np.empty((7,) + y.shape)
+        self.step = 0
+        K[0] = f(y, t)
+        dt = min(self.h, self.max_step)
+        filled = 1
+        self.nsteps = 0
+        bar = tqdm(total=self.n - 1) if self.verbose else None
+
+        while filled < self.n:
+            last = dt >= t_end - t
+            if last:
+                dt = t_end - t
+            for s in range(1, 7):
+                ys = y + dt * np.tensordot(_A[s], K[:s], axes=1)
+                K[s] = f(ys, t + _C[s] * dt)
+            # The last stage is evaluated at the 5th order solution.
+            y_new = ys
+            err = dt * np.tensordot(_E, K, axes=1)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            ratio = np.max(np.abs(err) / scale)
+
+            if ratio <= 1.0:
+                t_new = t_end if last else t + dt
+                stop = np.searchsorted(ts, t_new, side="right")
+                if stop > filled:
+                    theta = (ts[filled:stop] - t) / dt
+                    theta2 = theta * theta
+                    theta3 = theta2 * theta
+                    h00 = 2 * theta3 - 3 * theta2 + 1
+                    h10 = theta3 - 2 * theta2 + theta
+                    h01 = -2 * theta3 + 3 * theta2
+                    h11 = theta3 - theta2
+                    res[..., filled:stop] = (
+                        y[..., None] * h00
+                        + (dt * K[0])[..., None] * h10
+                        + y_new[..., None] * h01
+                        + (dt * K[6])[..., None] * h11
+                    )
+                    if bar is not None:
+                        bar.update(stop - filled)
+                    filled = stop
+                    self.step = filled - 1
+                t, y = t_new, y_new
+                K[0] = K[6]
+                self.nsteps += 1
+
+            factor = 5.0 if ratio == 0 else min(5.0, max(0.2, 0.9 * ratio**-0.2))
+            dt = min(dt * factor, self.max_step)
+            if t + dt == t:
+                raise RuntimeError(f"RK45 step size underflowed at t = {t}.")
+
+        if bar is not None:
+            bar.close()
+        return res
+
+
+if __name__ == "__main__":
+    # Example: Solve the differential equation dy/dt = y with initial condition y(0) = 1
+    from matplotlib import pyplot as plt
+
+    f = lambda y, t: y
+    y0 = 1
+    t0, t1 = 0, 10
+
+    rk45 = RK45(f, y0, t0, t1)
+    res = rk45.solve()
+
+    print(f"{rk45.nsteps} adaptive steps for {rk45.n} output points")
+    plt.plot(rk45.range, res[0])
+    plt.plot(rk45.range, np.e**rk45.range, "--")
+    plt.show()
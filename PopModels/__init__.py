@@ -12,6 +12,16 @@ from .delay import *
 
 from .model import PopModel
 
+_POPMODELS = {
+    "ContGrowth": ContGrowth,
+    "LogGrowth": LogGrowth,
+    "PreyPred": PreyPred,
+    "InfecDis": InfecDis,
+    "SIS": SIS,
+    "SIR": SIR,
+    "Delay": Delay,
+}
+
 
 def get_pop_model(name: str, **kwargs) -> PopModel:
     """
@@ -31,11 +41,9 @@ def get_pop_model(name: str, **kwargs) -> PopModel:
     Returns:
         PopModel: An instance of the specified population model.
     """
-    options = ["ContGrowth", "LogGrowth", "PreyPred", "InfecDis", "SIS", "SIR", "Delay"]
-
-    if name not in options:
+    if name not in _POPMODELS:
         raise ValueError(
-            f"Invalid model name '{name}'. Available options are: {', '.join(options)}"
+            f"Invalid model name '{name}'. Available options are: {', '.join(_POPMODELS)}"
         )
 
-    return eval(name)(**kwargs)
+    return _POPMODELS[name](**kwargs)
@@ -0,0 +1,408 @@
+"""
+This module generates integrator loops specialised to a model's right-hand side.
+
+A model describes its derivatives as expression strings in the state variables
+`x0, x1, ...`, the time `t` and its parameter names. The expressions are inlined
+into the source of a complete step loop that takes the parameter values as an
+array, and the result is compiled with Numba when it is available. The source is
+written to a module under `__pycache__/codegen`, so Numba caches the compiled loop
+on disk and later processes and parameter sets reuse it.
+
+Delay equations may also use `x0_lag, x1_lag, ...`, the state `lag` steps before
+the step being evaluated, read back from the output array; `lag` is then one of
+the parameters and is rounded to a whole number of steps.
+
+Every loop keeps the state in scalar locals, so a step is a handful of float
+operations with one array write per state variable.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import os
+import sys
+import numpy as np
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from NumSolvers._jit import njit, cuda_available
+
+try:
+    from numba import cfunc
+    from numbalsoda import lsoda, lsoda_sig
+except ImportError:
+    lsoda = None
+
+_CACHE: Dict[str, Callable] = {}
+_MXSTEP = np.iinfo(np.int32).max
+_SOURCE_DIR = Path(__file__).with_name("__pycache__") / "codegen"
+
+
+def rhs_names(rhs: Sequence[str]) -> Set[str]:
+    """
+    Collect the parameter names referenced by a set of derivative expressions.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+
+    Returns:
+        Set[str]: The names used in the expressions, excluding `t` and the state variables.
+            Includes `lag` if any delayed state is used.
+    """
+    state = {f"x{j}" for j in range(len(rhs))} | {"t"}
+    lagged = {f"x{j}_lag" for j in range(len(rhs))}
+    names = set()
+    for expr in rhs:
+        for node in ast.walk(ast.parse(expr, mode="eval")):
+            if isinstance(node, ast.Name) and node.id in lagged:
+                names.add("lag")
+            elif isinstance(node, ast.Name) and node.id not in state:
+                names.add(node.id)
+    return names
+
+
+def _unpack(names: Sequence[str], entry: str = "params[{row}]", pad: str = "    ") -> List[str]:
+    """
+    Lines binding each parameter to its entry of the parameter array, with `lag` as an integer step count.
+    """
+    lines = []
+    for row, name in enumerate(names):
+        value = entry.format(row=row)
+        lines.append(f"{pad}{name} = int({value})" if name == "lag" else f"{pad}{name} = {value}")
+    return lines
+
+
+def _lags(rhs: Sequence[str], pad: str, step: str) -> List[str]:
+    """
+    Lines reading the delayed states used by `rhs` for an evaluation at step `step`,
+    clamped to the initial state, as `Delay.diff` does.
+    """
+    return [
+        f"{pad}x{j}_lag = out[{j}, {step} - lag] if {step} >= lag else out[{j}, 0]"
+        for j in range(len(rhs))
+        if any(f"x{j}_lag" in expr for expr in rhs)
+    ]
+
+
+def _load(source: str, name: str) -> Optional[Callable]:
+    """
+    Import generated source from a module file under `_SOURCE_DIR`.
+
+    Numba can only cache functions whose source lives in a file, so this is what lets
+    `cache=True` keep the compiled loop between processes.
+
+    Args:
+        source (str): The Python source defining the function.
+        name (str): The name of the function to return.
+
+    Returns:
+        Optional[Callable]: The function, or None if the directory is not writable.
+    """
+    module = f"_{name}_{hashlib.sha1(source.encode()).hexdigest()[:16]}"
+    path = _SOURCE_DIR / f"{module}.py"
+    try:
+        if not path.exists():
+            _SOURCE_DIR.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name so concurrent processes never import a partial file.
+            tmp = path.with_name(f"{module}.{os.getpid()}.tmp")
+            tmp.write_text(source)
+            os.replace(tmp, path)
+    except OSError:
+        return None
+
+    spec = importlib.util.spec_from_file_location(module, path)
+    namespace = importlib.util.module_from_spec(spec)
+    # Numba looks the module up by name when it loads a cached loop.
+    sys.modules[module] = namespace
+    spec.loader.exec_module(namespace)
+    return getattr(namespace, name)
+
+
+def _compile(source: str, name: str, target: str = "cpu") -> Callable:
+    """
+    Execute generated source and return the named function, compiled when possible.
+
+    Args:
+        source (str): The Python source defining the function.
+        name (str): The name of the function to return.
+        target (str, optional): "cpu" to compile with `njit`, "cuda" to compile a CUDA kernel, or
+            "lsoda" to compile a C callback for `numbalsoda.lsoda`. Defaults to "cpu".
+
+    Returns:
+        Callable: The (possibly jitted) function, cached by its source in memory, and on
+            disk for the "cpu" and "lsoda" targets.
+    """
+    if source not in _CACHE:
+        namespace = {}
+        if target == "cuda":
+            from numba import cuda
+
+            namespace["cuda"] = cuda
+            exec(compile(source, f"<generated {name}>", "exec"), namespace)
+            _CACHE[source] = cuda.jit(namespace[name])
+        else:
+            fn = _load(source, name)
+            cache = fn is not None
+            if fn is None:
+                exec(compile(source, f"<generated {name}>", "exec"), namespace)
+                fn = namespace[name]
+            if target == "lsoda":
+                _CACHE[source] = cfunc(lsoda_sig, cache=cache)(fn)
+            else:
+                _CACHE[source] = njit(cache=cache)(fn)
+    return _CACHE[source]
+
+
+def make_fwdeuler(rhs: Sequence[str], names: Sequence[str]) -> Callable:
+    """
+    Generate a forward Euler loop with the right-hand side inlined.
+
+    The generated function has the signature `fwdeuler(out, ts, h, params)` and fills
+    `out[:, 1:]` from the initial state in `out[:, 0]`, following `NumSolvers.FwdEuler`.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names used in `rhs`, in the order of the array `params`.
+
+    Returns:
+        Callable: The generated step loop.
+    """
+    d = len(rhs)
+    lines = ["def fwdeuler(out, ts, h, params):"]
+    lines += _unpack(names)
+    lines += [f"    y{j} = out[{j}, 0]" for j in range(d)]
+    lines += ["    for i in range(1, ts.size):", "        t = ts[i] - h"]
+    lines += [f"        x{j} = y{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k_{j} = {rhs[j]}" for j in range(d)]
+    lines += [f"        y{j} = y{j} + h * k_{j}" for j in range(d)]
+    lines += [f"        out[{j}, i] = y{j}" for j in range(d)]
+    return _compile("\n".join(lines) + "\n", "fwdeuler")
+
+
+def make_modeuler(rhs: Sequence[str], names: Sequence[str]) -> Callable:
+    """
+    Generate a modified Euler loop with the right-hand side inlined.
+
+    The generated function has the signature `modeuler(out, ts, h, params, eps)` and fills
+    `out[:, 1:]` from the initial state in `out[:, 0]`, following `NumSolvers.ModEuler`:
+    a forward Euler predictor, then trapezoidal corrections until successive
+    iterates agree to within `eps` in every state variable.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names used in `rhs`, in the order of the array `params`.
+
+    Returns:
+        Callable: The generated step loop.
+    """
+    d = len(rhs)
+    gaps = [f"abs(p{j} - q{j})" for j in range(d)]
+    gap = gaps[0] if d == 1 else f"max({', '.join(gaps)})"
+
+    def correct(pad):
+        lines = [f"{pad}x{j} = p{j}" for j in range(d)]
+        lines += _lags(rhs, pad, "i")
+        lines += [f"{pad}k_{j} = {rhs[j]}" for j in range(d)]
+        lines += [f"{pad}q{j} = b{j} + half_h * k_{j}" for j in range(d)]
+        return lines
+
+    lines = ["def modeuler(out, ts, h, params, eps):"]
+    lines += _unpack(names)
+    lines += ["    half_h = 0.5 * h"]
+    lines += [f"    y{j} = out[{j}, 0]" for j in range(d)]
+    lines += ["    for i in range(1, ts.size):", "        t = ts[i] - h"]
+    lines += [f"        x{j} = y{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k_{j} = {rhs[j]}" for j in range(d)]
+    lines += [f"        b{j} = y{j} + half_h * k_{j}" for j in range(d)]
+    lines += ["        t = ts[i]"]
+    lines += _lags(rhs, "        ", "i")
+    lines += [f"        k_{j} = {rhs[j]}" for j in range(d)]
+    lines += [f"        p{j} = y{j} + h * k_{j}" for j in range(d)]
+    lines += correct("        ")
+    lines += [f"        while {gap} > eps:"]
+    lines += [f"            p{j} = q{j}" for j in range(d)]
+    lines += correct("            ")
+    lines += [f"        y{j} = p{j}" for j in range(d)]
+    lines += [f"        out[{j}, i] = y{j}" for j in range(d)]
+    return _compile("\n".join(lines) + "\n", "modeuler")
+
+
+def make_rk2(rhs: Sequence[str], names: Sequence[str]) -> Callable:
+    """
+    Generate an RK2 loop with the right-hand side inlined.
+
+    The generated function has the signature `rk2(out, ts, h, params)` and fills
+    `out[:, 1:]` from the initial state in `out[:, 0]`, following `NumSolvers.RK2`.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names used in `rhs`, in the order of the array `params`.
+
+    Returns:
+        Callable: The generated step loop.
+    """
+    d = len(rhs)
+    lines = ["def rk2(out, ts, h, params):"]
+    lines += _unpack(names)
+    lines += [f"    y{j} = out[{j}, 0]" for j in range(d)]
+    lines += ["    for i in range(1, ts.size):", "        t = ts[i] - h"]
+    lines += [f"        x{j} = y{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k1_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        x{j} = y{j} + h * k1_{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k2_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        y{j} = y{j} + 0.5 * (k1_{j} + k2_{j})" for j in range(d)]
+    lines += [f"        out[{j}, i] = y{j}" for j in range(d)]
+    return _compile("\n".join(lines) + "\n", "rk2")
+
+
+def make_rk4(rhs: Sequence[str], names: Sequence[str]) -> Callable:
+    """
+    Generate an RK4 loop with the right-hand side inlined.
+
+    The generated function has the signature `rk4(out, ts, h, params)` and fills
+    `out[:, 1:]` from the initial state in `out[:, 0]`, following `NumSolvers.RK4`.
+    The stages are unrolled over the state variables, so for a one-dimensional
+    model each step is a handful of scalar operations.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names used in `rhs`, in the order of the array `params`.
+
+    Returns:
+        Callable: The generated step loop.
+    """
+    d = len(rhs)
+    lines = ["def rk4(out, ts, h, params):"]
+    lines += _unpack(names)
+    lines += ["    half_h = 0.5 * h"]
+    lines += [f"    y{j} = out[{j}, 0]" for j in range(d)]
+    lines += ["    for i in range(1, ts.size):", "        t = ts[i] - h"]
+    lines += [f"        x{j} = y{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k1_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        x{j} = y{j} + half_h * k1_{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k2_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        x{j} = y{j} + half_h * k2_{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k3_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        x{j} = y{j} + h * k3_{j}" for j in range(d)]
+    lines += _lags(rhs, "        ", "i - 1")
+    lines += [f"        k4_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"        y{j} = y{j} + (k1_{j} + 2 * k2_{j} + 2 * k3_{j} + k4_{j}) / 6" for j in range(d)]
+    lines += [f"        out[{j}, i] = y{j}" for j in range(d)]
+    return _compile("\n".join(lines) + "\n", "rk4")
+
+
+def make_lsoda(rhs: Sequence[str], names: Sequence[str]) -> Callable:
+    """
+    Generate an LSODA loop that runs entirely in compiled code through `numbalsoda`.
+
+    The right-hand side is compiled as a C callback that reads the parameters from
+    numbalsoda's data pointer, so `numbalsoda.lsoda` integrates without calling back
+    into Python. The returned function has the signature `lsoda(out, ts, params, rtol, atol)`
+    and fills `out` from the initial state in `out[:, 0]`, sampled on `ts` like `NumSolvers.LSODA`.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable, without delayed terms.
+        names (Sequence[str]): The parameter names used in `rhs`, in the order of the array `params`.
+
+    Returns:
+        Callable: The step loop.
+    """
+    d = len(rhs)
+    lines = ["def lsoda_rhs(t, y, dy, params):"]
+    lines += _unpack(names)
+    lines += [f"    x{j} = y[{j}]" for j in range(d)]
+    lines += [f"    dy[{j}] = {rhs[j]}" for j in range(d)]
+    address = _compile("\n".join(lines) + "\n", "lsoda_rhs", "lsoda").address
+
+    def run(out, ts, params, rtol, atol):
+        # No cap on the internal steps between output times, as with SciPy's LSODA.
+        sol, success = lsoda(
+            address, np.ascontiguousarray(out[:, 0]), ts, data=params, rtol=rtol, atol=atol, mxstep=_MXSTEP
+        )
+        if not success:
+            raise RuntimeError("numbalsoda's LSODA failed.")
+        out[:] = sol.T
+
+    return run
+
+
+def make_rk2_batch(rhs: Sequence[str], names: Sequence[str], target: str = "cpu") -> Callable:
+    """
+    Generate an RK2 loop that integrates one trajectory per parameter set.
+
+    The generated function has the signature `rk2_batch(out, params, ts, h)`, where `out`
+    has shape (d, B, n) with the initial states in `out[:, :, 0]` and `params` has shape
+    (len(names), B). On the "cuda" target each GPU thread integrates one trajectory; on
+    the "cpu" target the trajectories are integrated in turn.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names, in the row order of `params`.
+        target (str, optional): "cpu" or "cuda". Defaults to "cpu".
+
+    Returns:
+        Callable: The generated kernel.
+    """
+    d = len(rhs)
+    lines = ["def rk2_batch(out, params, ts, h):"]
+    if target == "cuda":
+        lines += ["    b = cuda.grid(1)", "    if b >= out.shape[1]:", "        return"]
+        pad = "    "
+    else:
+        lines += ["    for b in range(out.shape[1]):"]
+        pad = "        "
+    lines += _unpack(names, "params[{row}, b]", pad)
+    lines += [f"{pad}y{j} = out[{j}, b, 0]" for j in range(d)]
+    lines += [f"{pad}for i in range(1, ts.size):", f"{pad}    t = ts[i] - h"]
+    lines += [f"{pad}    x{j} = y{j}" for j in range(d)]
+    lines += [f"{pad}    k1_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"{pad}    x{j} = y{j} + h * k1_{j}" for j in range(d)]
+    lines += [f"{pad}    k2_{j} = h * ({rhs[j]})" for j in range(d)]
+    lines += [f"{pad}    y{j} = y{j} + 0.5 * (k1_{j} + k2_{j})" for j in range(d)]
+    lines += [f"{pad}    out[{j}, b, i] = y{j}" for j in range(d)]
+    return _compile("\n".join(lines) + "\n", "rk2_batch", target)
+
+
+def run_rk2_batch(
+    rhs: Sequence[str],
+    names: Sequence[str],
+    out: np.ndarray,
+    params: np.ndarray,
+    ts: np.ndarray,
+    h: float,
+    threads_per_block: int = 128,
+) -> np.ndarray:
+    """
+    Run a generated batch RK2 loop, on the GPU when CUDA is available.
+
+    Args:
+        rhs (Sequence[str]): One expression per state variable.
+        names (Sequence[str]): The parameter names, in the row order of `params`.
+        out (np.ndarray): Output array of shape (d, B, n) holding the initial states in `out[:, :, 0]`.
+        params (np.ndarray): Parameter values of shape (len(names), B).
+        ts (np.ndarray): The time grid.
+        h (float): The step size.
+        threads_per_block (int, optional): CUDA block size. Defaults to 128.
+
+    Returns:
+        np.ndarray: `out`, filled with the trajectories.
+    """
+    if not cuda_available():
+        make_rk2_batch(rhs, names, "cpu")(out, params, ts, h)
+        return out
+
+    from numba import cuda
+
+    kernel = make_rk2_batch(rhs, names, "cuda")
+    blocks = (out.shape[1] + threads_per_block - 1) // threads_per_block
+    d_out = cuda.to_device(out)
+    kernel[blocks, threads_per_block](d_out, cuda.to_device(params), cuda.to_device(ts), h)
+    d_out.copy_to_host(out)
+    return out
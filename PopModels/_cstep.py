@@ -0,0 +1,40 @@
+"""
+This module loads the optional compiled SIR step loop built from `pop_step.c`.
+
+The shared library is not built automatically. When `_pop_step.so` is missing or
+cannot be loaded, `modeuler_sir_c` is None and callers fall back to the Numba loops.
+"""
+
+import ctypes
+import numpy as np
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def _load() -> Optional[Callable]:
+    """
+    Load `modeuler_sir` from the shared library next to this module.
+
+    Returns:
+        Optional[Callable]: The C function, called as `modeuler_sir_c(out, n, beta, gamma, h, eps)`
+            with `out` a C-contiguous (3, n) float64 array, or None if the library is unavailable.
+    """
+    try:
+        lib = ctypes.CDLL(str(Path(__file__).with_name("_pop_step.so")))
+    except OSError:
+        return None
+
+    fn = lib.modeuler_sir
+    fn.argtypes = [
+        np.ctypeslib.ndpointer(np.float64, ndim=2, flags="C_CONTIGUOUS"),
+        ctypes.c_long,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+    ]
+    fn.restype = None
+    return fn
+
+
+modeuler_sir_c = _load()
@@ -0,0 +1,97 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the SIR step loops in `_kernels`, used when Numba is not installed.
+
+Each loop has the same signature and fills `out[:, 1:]` of a C-contiguous (3, n)
+float64 array in the same way as its counterpart in `_kernels`. The module is not
+built automatically; build it in place with:
+    cythonize -i PopModels/_csteppers.pyx
+"""
+
+from libc.math cimport fabs
+
+
+cdef inline void _sir(double S, double I, double beta, double gamma,
+                      double *dS, double *dI, double *dR) noexcept nogil:
+    cdef double b = beta * S * I
+    cdef double g = gamma * I
+    dS[0] = -b
+    dI[0] = b - g
+    dR[0] = g
+
+
+def fwdeuler_sir(double[:, ::1] out, double[::1] ts, double h, double beta, double gamma):
+    """
+    Forward Euler step loop for the SIR model.
+    """
+    cdef Py_ssize_t i, n = ts.shape[0]
+    cdef double S = out[0, 0], I = out[1, 0], R = out[2, 0]
+    cdef double dS, dI, dR
+    with nogil:
+        for i in range(1, n):
+            _sir(S, I, beta, gamma, &dS, &dI, &dR)
+            S = S + h * dS
+            I = I + h * dI
+            R = R + h * dR
+            out[0, i] = S
+            out[1, i] = I
+            out[2, i] = R
+
+
+def modeuler_sir(double[:, ::1] out, double[::1] ts, double h, double beta, double gamma, double eps):
+    """
+    Modified Euler step loop for the SIR model.
+    """
+    cdef Py_ssize_t i, n = ts.shape[0]
+    cdef double half_h = 0.5 * h
+    cdef double S = out[0, 0], I = out[1, 0], R = out[2, 0]
+    cdef double dS, dI, dR, bS, bI, bR, yS, yI, yR, tS, tI, tR
+    with nogil:
+        for i in range(1, n):
+            _sir(S, I, beta, gamma, &dS, &dI, &dR)
+            bS = S + half_h * dS
+            bI = I + half_h * dI
+            bR = R + half_h * dR
+            yS = S + h * dS
+            yI = I + h * dI
+            yR = R + h * dR
+            _sir(yS, yI, beta, gamma, &dS, &dI, &dR)
+            tS = bS + half_h * dS
+            tI = bI + half_h * dI
+            tR = bR + half_h * dR
+            while fabs(yS - tS) > eps or fabs(yI - tI) > eps or fabs(yR - tR) > eps:
+                yS, yI, yR = tS, tI, tR
+                _sir(yS, yI, beta, gamma, &dS, &dI, &dR)
+                tS = bS + half_h * dS
+                tI = bI + half_h * dI
+                tR = bR + half_h * dR
+            S, I, R = yS, yI, yR
+            out[0, i] = S
+            out[1, i] = I
+            out[2, i] = R
+
+
+def rk4_sir(double[:, ::1] out, double[::1] ts, double h, double beta, double gamma):
+    """
+    RK4 step loop for the SIR model.
+    """
+    cdef Py_ssize_t i, n = ts.shape[0]
+    cdef double half_h = 0.5 * h
+    cdef double S = out[0, 0], I = out[1, 0], R = out[2, 0]
+    cdef double dS, dI, dR, k1S, k1I, k1R, k2S, k2I, k2R, k3S, k3I, k3R, k4S, k4I, k4R
+    with nogil:
+        for i in range(1, n):
+            _sir(S, I, beta, gamma, &dS, &dI, &dR)
+            k1S, k1I, k1R = h * dS, h * dI, h * dR
+            _sir(S + half_h * k1S, I + half_h * k1I, beta, gamma, &dS, &dI, &dR)
+            k2S, k2I, k2R = h * dS, h * dI, h * dR
+            _sir(S + half_h * k2S, I + half_h * k2I, beta, gamma, &dS, &dI, &dR)
+            k3S, k3I, k3R = h * dS, h * dI, h * dR
+            _sir(S + h * k3S, I + h * k3I, beta, gamma, &dS, &dI, &dR)
+            k4S, k4I, k4R = h * dS, h * dI, h * dR
+            S = S + (k1S + 2 * k2S + 2 * k3S + k4S) / 6
+            I = I + (k1I + 2 * k2I + 2 * k3I + k4I) / 6
+            R = R + (k1R + 2 * k2R + 2 * k3R + k4R) / 6
+            out[0, i] = S
+            out[1, i] = I
+            out[2, i] = R
@@ -0,0 +1,84 @@
+"""
+This module contains step loops for the SIR model with the right-hand side fused in.
+
+Each kernel fills `out[:, 1:]` of a (3, n) results array from the initial state in
+`out[:, 0]`, following the matching solver in `NumSolvers` step for step, but keeps
+the state in scalars so that no arrays are created between steps.
+
+Without Numba these are plain Python loops, so the Cython build of the same loops in
+`_csteppers.pyx` is used instead when it has been compiled.
+"""
+
+from NumSolvers._jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, fastmath=True)
+def _sir(S, I, beta, gamma):
+    """
+    SIR right-hand side on scalars, returning (dS/dt, dI/dt, dR/dt).
+    """
+    b = beta * S * I
+    g = gamma * I
+    return -b, b - g, g
+
+
+@njit(cache=True, fastmath=True)
+def fwdeuler_sir(out, ts, h, beta, gamma):
+    """
+    Forward Euler step loop for the SIR model.
+    """
+    S, I, R = out[0, 0], out[1, 0], out[2, 0]
+    for i in range(1, ts.size):
+        dS, dI, dR = _sir(S, I, beta, gamma)
+        S, I, R = S + h * dS, I + h * dI, R + h * dR
+        out[0, i], out[1, i], out[2, i] = S, I, R
+
+
+@njit(cache=True, fastmath=True)
+def modeuler_sir(out, ts, h, beta, gamma, eps):
+    """
+    Modified Euler step loop for the SIR model.
+    """
+    half_h = 0.5 * h
+    S, I, R = out[0, 0], out[1, 0], out[2, 0]
+    for i in range(1, ts.size):
+        dS, dI, dR = _sir(S, I, beta, gamma)
+        bS, bI, bR = S + half_h * dS, I + half_h * dI, R + half_h * dR
+        yS, yI, yR = S + h * dS, I + h * dI, R + h * dR
+        dS, dI, dR = _sir(yS, yI, beta, gamma)
+        tS, tI, tR = bS + half_h * dS, bI + half_h * dI, bR + half_h * dR
+        while max(abs(yS - tS), abs(yI - tI), abs(yR - tR)) > eps:
+            yS, yI, yR = tS, tI, tR
+            dS, dI, dR = _sir(yS, yI, beta, gamma)
+            tS, tI, tR = bS + half_h * dS, bI + half_h * dI, bR + half_h * dR
+        S, I, R = yS, yI, yR
+        out[0, i], out[1, i], out[2, i] = S, I, R
+
+
+@njit(cache=True, fastmath=True)
+def rk4_sir(out, ts, h, beta, gamma):
+    """
+    RK4 step loop for the SIR model.
+    """
+    half_h = 0.5 * h
+    S, I, R = out[0, 0], out[1, 0], out[2, 0]
+    for i in range(1, ts.size):
+        dS, dI, dR = _sir(S, I, beta, gamma)
+        k1S, k1I, k1R = h * dS, h * dI, h * dR
+        dS, dI, dR = _sir(S + half_h * k1S, I + half_h * k1I, beta, gamma)
+        k2S, k2I, k2R = h * dS, h * dI, h * dR
+        dS, dI, dR = _sir(S + half_h * k2S, I + half_h * k2I, beta, gamma)
+        k3S, k3I, k3R = h * dS, h * dI, h * dR
+        dS, dI, dR = _sir(S + h * k3S, I + h * k3I, beta, gamma)
+        k4S, k4I, k4R = h * dS, h * dI, h * dR
+        S = S + (k1S + 2 * k2S + 2 * k3S + k4S) / 6
+        I = I + (k1I + 2 * k2I + 2 * k3I + k4I) / 6
+        R = R + (k1R + 2 * k2R + 2 * k3R + k4R) / 6
+        out[0, i], out[1, i], out[2, i] = S, I, R
+
+
+if not NUMBA_AVAILABLE:
+    try:
+        from ._csteppers import fwdeuler_sir, modeuler_sir, rk4_sir
+    except ImportError:
+        pass
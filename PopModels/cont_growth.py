@@ -19,6 +19,8 @@ class ContGrowth(PopModel):
     A class to model continuous growth using a differential equation.
     """
 
+    rhs = ("k * x0",)
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -55,4 +57,17 @@ class ContGrowth(PopModel):
         Returns:
             np.ndarray: Derivative (rate of change of population).
         """
-        return self.k * x
+        return np.multiply(self.k, x, out=self._dxdt)
+
+    def jac(self, x: np.ndarray, _: Any) -> np.ndarray:
+        """
+        Compute the Jacobian of the continuous growth model.
+
+        Args:
+            x (np.ndarray): Current state of the system (population).
+            _ (Any): Placeholder for time (not used in this function).
+
+        Returns:
+            np.ndarray: Jacobian matrix d(dX/dt)/dX.
+        """
+        return self.k * np.eye(len(x))
@@ -13,6 +13,7 @@ where:
 import numpy as np
 from typing import Union, List
 
+from NumSolvers import SolveIVP, BlockBackwardEuler
 from .model import PopModel, Method
 
 
@@ -21,6 +22,8 @@ class Delay(PopModel):
     The Delay class models population growth with a time delay in the feedback mechanism.
     """
 
+    rhs = ("r * (x0 * (1 - x0_lag / k))",)
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -32,6 +35,7 @@ class Delay(PopModel):
         tmax: Union[float, None],
         h: Union[float, None],
         eps=1e-10,
+        chunk: int = 64,
     ):
         """
         Initialize the Delay model.
@@ -39,18 +43,33 @@ class Delay(PopModel):
         Args:
             X0 (Union[int, float, np.ndarray, List[Union[int, float]]]): Initial population.
             r (float): Growth rate.
-            T (float): Time delay.
+            T (float): Time delay. Rounded to a whole number of steps, which must be at least one.
             K (float): Carrying capacity.
-            method (Union[str, Method]): Numerical method for solving the differential equation.
+            method (Union[str, Method]): Numerical method for solving the differential equation. The
+                SciPy-backed methods (`BDF`, `LSODA`) only fill in results at the end, so they cannot be used.
             tmin (Union[float, None]): Minimum time value.
             tmax (Union[float, None]): Maximum time value.
             h (Union[float, None]): Step size.
             eps (float, optional): Tolerance for numerical method. Defaults to 1e-10.
+            chunk (int, optional): The number of steps BlockBackwardEuler solves together, capped at the
+                delay in steps since the delayed state must already be solved. Defaults to 64.
         """
-        super().__init__(method, X0, tmin, tmax, h, eps)
+        # The delay in steps, as read by `rhs`.
+        lag = int(round(T / h))
+        if lag < 1:
+            # A zero lag would read the state being solved for, before it has been written.
+            raise ValueError(f"Delay T={T} rounds to {lag} steps of h={h}; it must be at least one step.")
+        super().__init__(method, X0, tmin, tmax, h, eps, min(chunk, lag))
+        if isinstance(self.method, SolveIVP):
+            raise ValueError("Delay reads its history from the solver's results, which SolveIVP only fills at the end.")
+        if isinstance(self.method, BlockBackwardEuler) and self.method.chunk > lag:
+            raise ValueError(
+                f"BlockBackwardEuler solves {self.method.chunk} steps at once, more than the delay of {lag} steps."
+            )
         self.r = r
         self.t = T
         self.k = K
+        self.lag = lag
 
     def diff(self, x: np.ndarray, t: np.ndarray) -> np.ndarray:
         """
@@ -63,8 +82,23 @@ class Delay(PopModel):
         Returns:
             np.ndarray: Derivative dx/dt.
         """ 
-        return (
-            self.r
-            * x
-            * (1 - (self.method.res[max(0, round((t - self.t) / self.h))] / self.k))
-        )
+        idx = self.method.step - self.lag
+        d = self._dxdt
+        np.divide(self.method.res[..., idx if idx >= 0 else 0], self.k, out=d)
+        np.subtract(1.0, d, out=d)
+        np.multiply(x, d, out=d)
+        return np.multiply(self.r, d, out=d)
+
+    def jac(self, x: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the Delay model.
+
+        Args:
+            x (np.ndarray): Current population size.
+            t (np.ndarray): Current time.
+
+        Returns:
+            np.ndarray: Jacobian d(dx/dt)/dx, treating the delayed population x(t - T) as fixed.
+        """
+        idx = self.method.step - self.lag
+        return np.diag(self.r * (1 - self.method.res[..., idx if idx >= 0 else 0] / self.k))
@@ -22,6 +22,11 @@ class InfecDis(PopModel):
     using a simple compartmental model.
     """
 
+    rhs = (
+        "-(beta * x0 * x1)",
+        "beta * x0 * x1",
+    )
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -58,9 +63,28 @@ class InfecDis(PopModel):
         Returns:
             np.ndarray: Derivatives [dS/dt, dI/dt].
         """
+        d = self._dxdt
+        b = self.beta * x[0] * x[1]
+        d[0] = -b
+        d[1] = b
+        return d
+
+    def jac(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the infectious disease model.
+
+        Args:
+            x (np.ndarray): Current state of the system [S, I].
+            _ (np.ndarray): Time array (not used in this function).
+
+        Returns:
+            np.ndarray: Jacobian of [dS/dt, dI/dt] with respect to [S, I].
+        """
+        bS = self.beta * x[0]
+        bI = self.beta * x[1]
         return np.array(
             [
-                -self.beta * x[0] * x[1],
-                self.beta * x[0] * x[1],
+                [-bI, -bS],
+                [bI, bS],
             ]
         )
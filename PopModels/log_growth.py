@@ -19,6 +19,9 @@ class LogGrowth(PopModel):
     """
     Logistic Growth Model
     """
+
+    rhs = ("r * x0 * (1 - (x0 / m))",)
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -58,4 +61,21 @@ class LogGrowth(PopModel):
         Returns:
             np.ndarray: Derivative dx/dt.
         """
-        return self.r * x * (1 - (x / self.m))
+        d = self._dxdt
+        np.divide(x, self.m, out=d)
+        np.subtract(1.0, d, out=d)
+        np.multiply(x, d, out=d)
+        return np.multiply(self.r, d, out=d)
+
+    def jac(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the logistic growth model.
+
+        Args:
+            x (np.ndarray): Population size.
+            _ (np.ndarray): Time vector (not used in this model).
+
+        Returns:
+            np.ndarray: Jacobian d(dx/dt)/dx.
+        """
+        return np.diag(self.r * (1 - 2 * x / self.m))
@@ -3,15 +3,39 @@ This module defines the PopModel class for simulating population models using va
 """
 
 import numpy as np
-from typing import Union, List, Optional
-from NumSolvers import get_method, Method
+from typing import Union, List, Optional, Callable, Tuple, Dict
+from NumSolvers import get_method, Method, FwdEuler, ModEuler, RK2, RK4, NumbaLSODA
+from NumSolvers._jit import NUMBA_AVAILABLE
+
+from ._codegen import lsoda, make_fwdeuler, make_lsoda, make_modeuler, make_rk2, make_rk4, rhs_names, run_rk2_batch
+
+# Loop generators for the methods that have one, keyed by method class. ModEuler's also takes its tolerance.
+_GENERATORS = {FwdEuler: make_fwdeuler, ModEuler: make_modeuler, RK2: make_rk2, RK4: make_rk4}
+# Below this many steps the generic solvers finish before Numba has loaded a compiled loop
+# (about 0.15 s for the first one in a process, even from the disk cache).
+_MIN_COMPILED_STEPS = 20_000
+# NumbaLSODA runs on a compiled callback when numbalsoda is installed; it takes its tolerances.
+if lsoda is not None:
+    _GENERATORS[NumbaLSODA] = make_lsoda
 
 
 class PopModel:
     """_summary_
     This class provides a framework for simulating population models using various numerical methods.
     Subclasses should implement the `diff` method to define the specific differential equation governing the population model.
-    """    
+    Subclasses may also set `rhs` to the same equations written as expression strings in the state variables
+    `x0, x1, ...`, the time `t` and their parameter attribute names; solving with FwdEuler, ModEuler, RK2 or RK4
+    then runs a generated loop with the equations inlined and the state held in scalar locals, once the run is
+    long enough to be worth compiling for (see `_compiled_pays_off`). Delay equations may
+    use `x0_lag, ...` for the state `lag` steps back, with `lag` an attribute giving the delay in steps.
+    When `numbalsoda` is installed, NumbaLSODA integrates `rhs` as a compiled callback.
+    """
+
+    # Subclasses that add attributes without declaring their own slots get a `__dict__` as usual.
+    __slots__ = ("method", "h", "_dxdt", "f0", "_diff", "tmin", "tmax")
+
+    rhs: Optional[Tuple[str, ...]] = None
+
     def __init__(
         self,
         method: Union[str, Method],
@@ -20,34 +44,95 @@ class PopModel:
         tmax: Union[float, None] = None,
         h: Optional[float] = 1e-2,
         eps: Optional[float] = 1e-10,
+        chunk: Optional[int] = None,
     ):
         """
         Initializes the population model with the given numerical method and parameters.
 
         Args:
             method (Union[str, Method]): The numerical method to use for solving the model.
-            f0 (Union[int, float, np.ndarray, List[Union[int, float]], None], optional): Initial value(s) of the population. Defaults to None.
+            f0 (Union[int, float, np.ndarray, List[Union[int, float]], None], optional): Initial value(s) of the population. An array of shape (d, B) solves B initial conditions in one pass. Defaults to None.
             tmin (Union[float, None], optional): The start time for the simulation. Defaults to None.
             tmax (Union[float, None], optional): The end time for the simulation. Defaults to None.
             h (Optional[float], optional): The step size for the numerical method. Defaults to 1e-2.
             eps (Optional[float], optional): The tolerance for the numerical method (if applicable). Defaults to 1e-10.
+            chunk (Optional[int], optional): The number of steps BlockBackwardEuler solves together. Defaults to
+                None, which keeps the method's default.
         """
         if isinstance(method, Method):
             self.method = method
         else:
-            if isinstance(f0, (int, float)):
-                f0 = np.array([f0])
-
+            f0 = np.atleast_1d(np.asarray(f0, dtype=np.float64))
             args = {"f": self.diff, "f0": f0, "tmin": tmin, "tmax": tmax, "h": h}
-            if method == "ModEuler":
+            if method in ("ModEuler", "ImplicitEuler", "BlockBackwardEuler"):
                 args["eps"] = eps
+            if method == "BlockBackwardEuler" and chunk is not None:
+                args["chunk"] = chunk
+            if method in ("ImplicitEuler", "BlockBackwardEuler", "BDF", "LSODA", "NumbaLSODA") and type(self).jac is not PopModel.jac:
+                args["jac"] = self.jac
 
             self.method = get_method(method, **args)
         self.h = h
-        self.f0 = f0
+        # Output buffer for `diff`, shaped like the state so batched states get one too.
+        self._dxdt = np.empty(np.shape(self.method.f0), dtype=np.float64)
+        self.f0 = self.method.f0
+        # Replacement for `diff` installed with `_set_diff`, if any.
+        self._diff = None
 
         self.tmin, self.tmax = tmin, tmax
-        self.range = np.arange(tmin, tmax, h)
+
+    @property
+    def range(self) -> np.ndarray:
+        """
+        The time grid, built once by the numerical method and shared with it.
+
+        Returns:
+            np.ndarray: The times at which the solution is computed.
+        """
+        return self.method.range
+
+    @property
+    def n(self) -> int:
+        """
+        The number of points in the time grid.
+
+        Returns:
+            int: The length of `self.range` and of the last axis of the solution.
+        """
+        return self.method.n
+
+    @classmethod
+    def batched(
+        cls,
+        X0: Union[int, float, np.ndarray, List[Union[int, float]]],
+        **kwargs,
+    ) -> "PopModel":
+        """
+        Builds a model that integrates one trajectory per parameter set in a single pass.
+
+        Parameters given as 1-D arrays of length K are broadcast against each other and against
+        the initial states, and the state is stored as a (d, K) array with one column per
+        trajectory. Each call to `diff` then evaluates all K trajectories at once.
+
+        Args:
+            X0 (Union[int, float, np.ndarray, List[Union[int, float]]]): Initial state of shape (d,),
+                shared by all trajectories, or (d, K) for one initial state per trajectory.
+            **kwargs: The model's constructor arguments. Parameters may be 1-D arrays of length K;
+                scalars are shared by all trajectories.
+
+        Returns:
+            PopModel: The model, whose `solve` returns an array of shape (d, K, len(self.range)).
+        """
+        X0 = np.atleast_1d(np.asarray(X0, dtype=np.float64))
+        sweep = {name: np.asarray(value, dtype=np.float64) for name, value in kwargs.items() if np.ndim(value) == 1}
+        shapes = [value.shape for value in sweep.values()]
+        if X0.ndim == 2:
+            shapes.append(X0.shape[1:])
+        (K,) = np.broadcast_shapes((1,), *shapes)
+
+        kwargs.update({name: np.broadcast_to(value, (K,)) for name, value in sweep.items()})
+        X0 = np.broadcast_to(X0 if X0.ndim == 2 else X0[:, np.newaxis], (X0.shape[0], K)).copy()
+        return cls(X0=X0, **kwargs)
 
     def diff(self, x: np.ndarray, t: np.ndarray) -> np.ndarray:
         """
@@ -61,15 +146,158 @@ class PopModel:
             t (np.ndarray): The current time.
 
         Returns:
-            np.ndarray: The computed derivative of the population.
+            np.ndarray: The computed derivative of the population. Implementations may
+                write into and return the preallocated `self._dxdt` buffer; solvers never
+                keep a reference to the returned array across calls.
         """
         pass
 
+    def jac(self, x: np.ndarray, t: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Computes the Jacobian of `diff` with respect to the state.
+
+        Subclasses may override this to supply an analytic Jacobian, which the implicit
+        methods (`ImplicitEuler`, `BlockBackwardEuler`, `BDF`, `LSODA`) then use for their Newton iterations.
+
+        Args:
+            x (np.ndarray): The current state of the population.
+            t (np.ndarray): The current time.
+
+        Returns:
+            Optional[np.ndarray]: The (d, d) Jacobian matrix, or None if not provided. Like `diff`,
+                implementations may return a reused buffer.
+        """
+        return None
+
     def solve(self):
         """
         Solves the population model using the specified numerical method.
 
         Returns:
-            np.ndarray: The solution of the population model over the specified time range.
+            np.ndarray: The solution of the population model over the specified time range. Each call
+                returns a new array, so changing parameters and solving again leaves earlier results intact.
         """
+        self.method._new_result()
+        kernel = self._kernel()
+        if kernel is not None:
+            kernel(self.method.res, self.method.range, self.h)
+            return self.method.res
         return self.method.solve()
+
+    def solve_batch(
+        self,
+        ics: Union[np.ndarray, List[float]],
+        params: Optional[Dict[str, Union[float, np.ndarray]]] = None,
+    ) -> np.ndarray:
+        """
+        Solves the model with RK2 for many initial conditions and parameter sets at once.
+
+        Each trajectory runs through a loop generated from `rhs`. The loop runs as a
+        CUDA kernel with one GPU thread per trajectory when Numba's CUDA target and a
+        GPU are available, and on the CPU otherwise.
+
+        Args:
+            ics (Union[np.ndarray, List[float]]): Initial states of shape (d, B), or (B,) for a
+                one-dimensional model.
+            params (Optional[Dict[str, Union[float, np.ndarray]]], optional): Parameter values by
+                name, each a scalar or an array of length B. Parameters not given keep the
+                model's own value; names that `rhs` does not use raise a ValueError. Defaults to None.
+
+        Returns:
+            np.ndarray: The trajectories, with shape (d, B, len(self.range)).
+        """
+        if self.rhs is None:
+            raise NotImplementedError(f"{type(self).__name__} does not define `rhs`.")
+        if "lag" in rhs_names(self.rhs):
+            raise NotImplementedError(f"{type(self).__name__} has delayed terms, which the batch loop does not support.")
+
+        ics = np.asarray(ics, dtype=np.float64)
+        if ics.ndim == 1:
+            ics = ics[np.newaxis, :]
+        if ics.shape[0] != len(self.rhs):
+            raise ValueError(f"Expected initial states of shape ({len(self.rhs)}, B), got {ics.shape}.")
+
+        params = params or {}
+        names = sorted(rhs_names(self.rhs))
+        unknown = sorted(set(params) - set(names))
+        if unknown:
+            raise ValueError(f"Unknown parameters {unknown} for {type(self).__name__}; expected some of {names}.")
+        table = np.empty((len(names), ics.shape[1]))
+        for row, name in zip(table, names):
+            row[:] = params.get(name, getattr(self, name))
+
+        ts = self.method.range
+        out = np.empty(ics.shape + (ts.size,))
+        out[..., 0] = ics
+        return run_rk2_batch(self.rhs, names, out, table, ts, self.h)
+
+    def _set_diff(self, diff: Callable):
+        """
+        Hands the method a faster equivalent of `diff`, such as a closure over the parameters.
+
+        The method only picks it up if it was solving this model's `diff` or an earlier
+        replacement, so models can call this again whenever their parameters change.
+
+        Args:
+            diff (Callable): The replacement, called as `diff(x, t)`.
+        """
+        if self._solves_self():
+            self.method.f = diff
+        self._diff = diff
+
+    def _solves_self(self) -> bool:
+        """
+        Checks whether the method is solving this model, through `diff` or its replacement.
+
+        Returns:
+            bool: True if the method's `f` is this model's derivative.
+        """
+        f = self.method.f
+        return f == self.diff or (self._diff is not None and f is self._diff)
+
+    def _compiled_pays_off(self) -> bool:
+        """
+        Checks whether the run is long enough to be worth loading a compiled loop for.
+
+        Returns:
+            bool: True without Numba, where the loops are plain Python and cost nothing to load,
+                or when the time grid has at least `_MIN_COMPILED_STEPS` points.
+        """
+        return not NUMBA_AVAILABLE or self.method.n >= _MIN_COMPILED_STEPS
+
+    def _kernel(self) -> Optional[Callable]:
+        """
+        Builds a step loop specialised to this model's `rhs`, if one applies.
+
+        Returns:
+            Optional[Callable]: The generated loop, called as `kernel(res, ts, h)` with the current
+                parameter values, or None when the model has no `rhs`, the method has no generator, does
+                not solve this model, the state or parameters are batched, or the run is too short to
+                be worth compiling for (except for NumbaLSODA).
+        """
+        method = self.method
+        generate = _GENERATORS.get(type(method))
+        if self.rhs is None or generate is None or not self._solves_self() or method.res.ndim != 2:
+            return None
+        # NumbaLSODA is only chosen to get the compiled path, so it always takes it.
+        if generate is not make_lsoda and not self._compiled_pays_off():
+            return None
+
+        names = sorted(rhs_names(self.rhs))
+        values = [getattr(self, name) for name in names]
+        if any(np.ndim(value) for value in values):
+            return None
+        params = np.array(values, dtype=np.float64)
+        if generate is make_lsoda:
+            if "lag" in names:
+                return None
+            loop = generate(self.rhs, names)
+            return lambda out, ts, h: loop(out, ts, params, method.rtol, method.atol)
+        if generate is make_modeuler:
+            # The generated loop has no Newton variant.
+            if method.jac is not None:
+                return None
+            loop = generate(self.rhs, names)
+            return lambda out, ts, h: loop(out, ts, h, params, method.eps)
+        loop = generate(self.rhs, names)
+        return lambda out, ts, h: loop(out, ts, h, params)
@@ -24,6 +24,11 @@ class PreyPred(PopModel):
     A class to model prey-predator dynamics using differential equations.
     """
 
+    rhs = (
+        "alpha * x0 - beta * (x0 * x1)",
+        "delta * (x0 * x1) - gamma * x1",
+    )
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -69,9 +74,27 @@ class PreyPred(PopModel):
         Returns:
             np.ndarray: Derivatives [dx/dt, dy/dt].
         """
+        d = self._dxdt
+        bxy = x[0] * x[1]
+        d[0] = self.alpha * x[0] - self.beta * bxy
+        d[1] = self.delta * bxy - self.gamma * x[1]
+        return d
+
+    def jac(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the PreyPred model.
+
+        Args:
+            x (np.ndarray): State vector [prey population, predator population].
+            _ (np.ndarray): Time vector (not used in this model).
+
+        Returns:
+            np.ndarray: Jacobian of [dx/dt, dy/dt] with respect to [x, y].
+        """
+        beta, delta = self.beta, self.delta
         return np.array(
             [
-                self.alpha * x[0] - self.beta * x[0] * x[1],
-                self.delta * x[0] * x[1] - self.gamma * x[1],
+                [self.alpha - beta * x[1], -beta * x[0]],
+                [delta * x[1], delta * x[0] - self.gamma],
             ]
         )
@@ -14,12 +14,36 @@ where:
 """
 
 import numpy as np
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Callable
 
+from NumSolvers import FwdEuler, ModEuler, RK4
+from NumSolvers._jit import njit, NUMBA_AVAILABLE
 from .model import PopModel, Method
+from ._kernels import fwdeuler_sir, modeuler_sir, rk4_sir
+from ._cstep import modeuler_sir_c
+
+
+@njit(cache=True, fastmath=True)
+def _sir_rhs(S, I, beta, gamma, out):
+    """
+    Compiled SIR right-hand side, written into `out`.
+    """
+    b = beta * S * I
+    g = gamma * I
+    out[0] = -b
+    out[1] = b - g
+    out[2] = g
 
 
 class SIR(PopModel):
+    __slots__ = ("_beta", "_gamma", "_J")
+
+    rhs = (
+        "-(beta * x0 * x1)",
+        "beta * x0 * x1 - gamma * x1",
+        "gamma * x1",
+    )
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -45,8 +69,48 @@ class SIR(PopModel):
             eps (Optional[float], optional): Tolerance for the numerical method. Defaults to 1e-10.
         """
         super().__init__(method, X0, tmin, tmax, h, eps)
-        self.beta = beta
-        self.gamma = gamma
+        self._beta = beta
+        self._gamma = gamma
+        # Jacobian buffer; its zero entries never change.
+        self._J = np.zeros((3, 3) + np.shape(self.f0)[1:])
+        self._bind()
+
+    @property
+    def beta(self) -> float:
+        """
+        Transmission rate. Setting it rebinds the solver's derivative.
+        """
+        return self._beta
+
+    @beta.setter
+    def beta(self, value: float):
+        self._beta = value
+        self._bind()
+
+    @property
+    def gamma(self) -> float:
+        """
+        Recovery rate. Setting it rebinds the solver's derivative.
+        """
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: float):
+        self._gamma = value
+        self._bind()
+
+    def _bind(self):
+        """
+        Hands the solver a closure equivalent to `diff`, with the current parameters and
+        output buffer captured instead of looked up per call.
+        """
+        beta, gamma, d = self._beta, self._gamma, self._dxdt
+
+        def diff(x, _):
+            _sir_rhs(x[0], x[1], beta, gamma, d)
+            return d
+
+        self._set_diff(diff)
 
     def diff(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
         """
@@ -59,10 +123,57 @@ class SIR(PopModel):
         Returns:
             np.ndarray: Derivatives [dS/dt, dI/dt, dR/dt].
         """
-        return np.array(
-            [
-                -self.beta * x[0] * x[1],
-                self.beta * x[0] * x[1] - self.gamma * x[1],
-                self.gamma * x[1],
-            ]
-        )
+        d = self._dxdt
+        _sir_rhs(x[0], x[1], self._beta, self._gamma, d)
+        return d
+
+    def jac(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the SIR model.
+
+        Args:
+            x (np.ndarray): State vector [S, I, R].
+            _ (np.ndarray): Time vector (not used in this model).
+
+        Returns:
+            np.ndarray: Jacobian of [dS/dt, dI/dt, dR/dt] with respect to [S, I, R].
+        """
+        J = self._J
+        bS = self._beta * x[0]
+        bI = self._beta * x[1]
+        J[0, 0] = -bI
+        J[0, 1] = -bS
+        J[1, 0] = bI
+        J[1, 1] = bS - self._gamma
+        J[2, 1] = self._gamma
+        return J
+
+    def _kernel(self) -> Optional[Callable]:
+        """
+        Picks a step loop with the SIR equations fused in, if one applies.
+
+        FwdEuler, ModEuler and RK4 use the hand-written scalar loops in `_kernels`; other
+        methods fall back to the loops generated from `rhs`. Without Numba, ModEuler uses
+        the C loop from `pop_step.c` instead when it has been built.
+
+        Returns:
+            Optional[Callable]: A loop called as `kernel(res, ts, h)`, or None when the method
+                has no fused loop, does not solve this model, the state or parameters are batched, or
+                the run is too short to be worth compiling for.
+        """
+        method = self.method
+        if not self._solves_self() or method.res.ndim != 2 or np.ndim(self.beta) or np.ndim(self.gamma):
+            return None
+        if not self._compiled_pays_off():
+            return None
+
+        beta, gamma = float(self.beta), float(self.gamma)
+        if type(method) is FwdEuler:
+            return lambda out, ts, h: fwdeuler_sir(out, ts, h, beta, gamma)
+        if type(method) is RK4:
+            return lambda out, ts, h: rk4_sir(out, ts, h, beta, gamma)
+        if type(method) is ModEuler and method.jac is None:
+            if not NUMBA_AVAILABLE and modeuler_sir_c is not None:
+                return lambda out, ts, h: modeuler_sir_c(out, out.shape[1], beta, gamma, h, method.eps)
+            return lambda out, ts, h: modeuler_sir(out, ts, h, beta, gamma, method.eps)
+        return super()._kernel()
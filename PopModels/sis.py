@@ -14,14 +14,34 @@ where:
 import numpy as np
 from typing import Union, List, Optional
 
+from NumSolvers._jit import njit
 from .model import PopModel, Method
 
+
+@njit(cache=True, fastmath=True)
+def _sis_rhs(S, I, beta, gamma, out):
+    """
+    Compiled SIS right-hand side, written into `out`.
+    """
+    b = beta * S * I - gamma * I
+    out[0] = -b
+    out[1] = b
+
+
 class SIS(PopModel):
     """
     SIS model for the spread of an infectious disease.
 
     This class models the spread of an infectious disease in a population using the Susceptible-Infected-Susceptible (SIS) model.
     """
+
+    __slots__ = ("_beta", "_gamma", "_J")
+
+    rhs = (
+        "-beta * x0 * x1 + gamma * x1",
+        "beta * x0 * x1 - gamma * x1",
+    )
+
     def __init__(
         self,
         X0: Union[int, float, np.ndarray, List[Union[int, float]]],
@@ -47,8 +67,47 @@ class SIS(PopModel):
             eps (Optional[float], optional): Tolerance for the numerical method. Defaults to 1e-10.
         """
         super().__init__(method, X0, tmin, tmax, h, eps)
-        self.beta = beta
-        self.gamma = gamma
+        self._beta = beta
+        self._gamma = gamma
+        self._J = np.empty((2, 2) + np.shape(self.f0)[1:])
+        self._bind()
+
+    @property
+    def beta(self) -> float:
+        """
+        Transmission rate. Setting it rebinds the solver's derivative.
+        """
+        return self._beta
+
+    @beta.setter
+    def beta(self, value: float):
+        self._beta = value
+        self._bind()
+
+    @property
+    def gamma(self) -> float:
+        """
+        Recovery rate. Setting it rebinds the solver's derivative.
+        """
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: float):
+        self._gamma = value
+        self._bind()
+
+    def _bind(self):
+        """
+        Hands the solver a closure equivalent to `diff`, with the current parameters and
+        output buffer captured instead of looked up per call.
+        """
+        beta, gamma, d = self._beta, self._gamma, self._dxdt
+
+        def diff(x, _):
+            _sis_rhs(x[0], x[1], beta, gamma, d)
+            return d
+
+        self._set_diff(diff)
 
     def diff(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
         """
@@ -60,10 +119,25 @@ class SIS(PopModel):
 
         Returns:
             np.ndarray: Derivatives [dS/dt, dI/dt].
-        """        
-        return np.array(
-            [
-                -self.beta * x[0] * x[1] + self.gamma * x[1],
-                self.beta * x[0] * x[1] - self.gamma * x[1],
-            ]
-        )
+        """
+        d = self._dxdt
+        _sis_rhs(x[0], x[1], self._beta, self._gamma, d)
+        return d
+
+    def jac(self, x: np.ndarray, _: np.ndarray) -> np.ndarray:
+        """
+        Compute the Jacobian of the derivatives for the SIS model.
+
+        Args:
+            x (np.ndarray): Current state of the system [S, I].
+            _ (np.ndarray): Time array (not used in this function).
+
+        Returns:
+            np.ndarray: Jacobian of [dS/dt, dI/dt] with respect to [S, I].
+        """
+        J = self._J
+        J[1, 0] = self._beta * x[1]
+        J[1, 1] = self._beta * x[0] - self._gamma
+        J[0, 0] = -J[1, 0]
+        J[0, 1] = -J[1, 1]
+        return J
@@ -1,3 +1,11 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
 from PopModels import get_pop_model
 """
 main.py
@@ -21,21 +29,17 @@ Models Demonstrated:
     7. Delay Differential Equation Model ("Delay")
         Parameters: X0 (initial population), r (growth rate), T (delay), K (carrying capacity), method, tmin, tmax, h
 Execution:
-    The script initializes each model with specified parameters, solves the model, and plots the results using PopulationPlotter.
+    The script solves the models in parallel worker processes (one per core, or in-process on a single core), then plots all results in one figure using
+    PopulationPlotter.plot_many in the main process. With --save-dir DIR the figure is written to
+    DIR/populations.png instead of being shown, so the script runs without a display.
 """
 from plotter import PopulationPlotter
 
-if __name__ == "__main__":
-    model = get_pop_model(
-        "ContGrowth", X0=40, k=0.25, method="RK4", tmin=0, tmax=10, h=1e-2
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["p"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "PreyPred",
+SPECS = [
+    dict(name="ContGrowth", labels=["p"], X0=40, k=0.25, method="RK4", tmin=0, tmax=10, h=1e-2),
+    dict(
+        name="PreyPred",
+        labels=["Prey", "Pred"],
         X0=[40, 9],
         alpha=0.1,
         beta=0.02,
@@ -45,36 +49,21 @@ if __name__ == "__main__":
         tmin=0,
         tmax=100,
         h=1e-2,
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["Prey", "Pred"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "LogGrowth", X0=140, M=3540, r=-0.04, method="RK4", tmin=0, tmax=10, h=1e-2
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["p"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "InfecDis",
+    ),
+    dict(name="LogGrowth", labels=["p"], X0=140, M=3540, r=-0.04, method="RK4", tmin=0, tmax=10, h=1e-2),
+    dict(
+        name="InfecDis",
+        labels=["S", "I"],
         X0=[999, 1],
         beta=0.00025,
         method="ModEuler",
         tmin=0,
         tmax=200,
         h=1e-2,
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["S", "I"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "SIS",
+    ),
+    dict(
+        name="SIS",
+        labels=["S", "I"],
         X0=[999, 1],
         beta=0.00025,
         gamma=0.1,
@@ -82,14 +71,10 @@ if __name__ == "__main__":
         tmin=0,
         tmax=200,
         h=1e-2,
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["S", "I"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "SIR",
+    ),
+    dict(
+        name="SIR",
+        labels=["S", "I", "R"],
         X0=[999, 1, 0],
         beta=0.00025,
         gamma=0.1,
@@ -97,14 +82,10 @@ if __name__ == "__main__":
         tmin=0,
         tmax=200,
         h=1e-2,
-    )
-    res = model.solve()
-
-    plotter = PopulationPlotter(model.range, res, labels=["S", "I", "R"])
-    plotter.plot()
-
-    model = get_pop_model(
-        "Delay",
+    ),
+    dict(
+        name="Delay",
+        labels=["P"],
         X0=0.8,
         r=12,
         T=0.11,
@@ -113,8 +94,47 @@ if __name__ == "__main__":
         tmin=0,
         tmax=30,
         h=0.05,
-    )
+    ),
+]
+
+
+def run_one(spec: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Builds and solves one model from its spec.
+
+    Args:
+        spec (Dict[str, Any]): The model name under "name", the plot labels under "labels", and
+            the keyword arguments for `get_pop_model`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: The time grid, the solution and the labels.
+    """
+    kwargs = dict(spec)
+    name = kwargs.pop("name")
+    labels = kwargs.pop("labels")
+    model = get_pop_model(name, **kwargs)
     res = model.solve()
+    return model.range, res, labels
+
 
-    plotter = PopulationPlotter(model.range, res, labels=["P"])
-    plotter.plot()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve and plot the example population models.")
+    parser.add_argument("--save-dir", type=Path, help="Save the figure to this directory instead of showing it.")
+    args = parser.parse_args()
+    if args.save_dir is not None:
+        args.save_dir.mkdir(parents=True, exist_ok=True)
+
+    # The models are independent, so solve them side by side and keep plotting in this process.
+    # Each worker pays for its own imports and compiled loops, so use no more than one per core
+    # and skip the pool entirely on a single core.
+    workers = min(len(SPECS), os.cpu_count() or 1)
+    if workers == 1:
+        results = [run_one(spec) for spec in SPECS]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(run_one, SPECS))
+
+    PopulationPlotter.plot_many(
+        [(xval, res, labels, spec["name"]) for spec, (xval, res, labels) in zip(SPECS, results)],
+        save_path=None if args.save_dir is None else args.save_dir / "populations.png",
+    )
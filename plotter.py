@@ -1,10 +1,18 @@
 """
 This module contains the PopulationPlotter class which is used to plot population trends over time.
+
+matplotlib is imported when a plot is first drawn, so importing this module stays cheap
+(for example in worker processes that only solve models). Plots that are only saved are drawn
+on a standalone Agg canvas without going through pyplot, so scripted runs never open or wait on
+a window and the session's backend is left alone. The backend for shown plots can be chosen with
+the `MPLBACKEND` (or `MPL_BACKEND`) environment variable.
 """
 
-import matplotlib.pyplot as plt
+import math
+import os
+import numpy as np
 from pathlib import Path
-from typing import List, Union, Iterable
+from typing import List, Union, Iterable, Optional, Sequence, Tuple
 
 
 class PopulationPlotter:
@@ -16,22 +24,27 @@ class PopulationPlotter:
     xval : Iterable
         An iterable containing the x-axis values (e.g., time points).
     data : Iterable
-        An iterable containing the y-axis values (e.g., population data).
+        An iterable containing the y-axis values (e.g., population data), one series per row.
     labels : List[str]
         A list of labels for the data series.
 
     Methods
     -------
-    plot(title="Population Trends", xlabel="Time", ylabel="Population", save_path=None)
+    plot(title="Population Trends", xlabel="Time", ylabel="Population", save_path=None, show=None, backend=None)
         Plots the population data with the given title, x-axis label, y-axis label, and optional save path.
+    plot_many(specs, cols=2, xlabel="Time", ylabel="Population", save_path=None, show=None, backend=None)
+        Plots several populations as a grid of subplots in one figure.
     """
+
+    __slots__ = ("xval", "data", "labels")
+
     def __init__(self, xval: Iterable, data: Iterable, labels: List[str] = []):
         """
         Initializes the PopulationPlotter with x-axis values, y-axis values, and optional labels.
 
         Args:
             xval (Iterable): An iterable containing the x-axis values (e.g., time points).
-            data (Iterable): An iterable containing the y-axis values (e.g., population data).
+            data (Iterable): An iterable containing the y-axis values (e.g., population data), one series per row.
             labels (List[str], optional): A list of labels for the data series. Defaults to [].
         """
         self.xval = xval
@@ -44,6 +57,8 @@ class PopulationPlotter:
         xlabel: str = "Time",
         ylabel: str = "Population",
         save_path: Union[str, Path, None] = None,
+        show: Optional[bool] = None,
+        backend: Optional[str] = None,
     ):
         """
         Plots the population data with the given title, x-axis label, y-axis label, and optional save path.
@@ -53,16 +68,126 @@ class PopulationPlotter:
             xlabel (str, optional): The label for the x-axis. Defaults to "Time".
             ylabel (str, optional): The label for the y-axis. Defaults to "Population".
             save_path (Union[str, Path, None], optional): The path to save the plot image. Defaults to None.
-        """        
-        plt.figure(figsize=(10, 6))
-        if self.labels:
-            plt.plot(self.xval, self.data, label=self.labels)
-            plt.legend()
-        else:
-            plt.plot(self.xval, self.data)
-        plt.title(title)
-        plt.xlabel(xlabel)
-        plt.ylabel(ylabel)
-        if save_path:
-            plt.savefig(save_path)
+            show (Optional[bool], optional): Whether to show the plot in a window. Defaults to None, which
+                shows it only when it is not saved.
+            backend (Optional[str], optional): A matplotlib backend to switch to before showing the plot.
+                Defaults to None.
+        """
+        fig, plt = _figure((10, 6), save_path, show, backend)
+        ax = fig.gca()
+        self._draw(ax, self.xval, self.data, self.labels)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        _finish(plt, fig, save_path)
+
+    @classmethod
+    def plot_many(
+        cls,
+        specs: Sequence[Tuple],
+        cols: int = 2,
+        xlabel: str = "Time",
+        ylabel: str = "Population",
+        save_path: Union[str, Path, None] = None,
+        show: Optional[bool] = None,
+        backend: Optional[str] = None,
+    ):
+        """
+        Plots several populations as a grid of subplots in one figure, shown once.
+
+        Args:
+            specs (Sequence[Tuple]): One `(xval, data, labels)` or `(xval, data, labels, title)` tuple
+                per subplot, with `data` holding one series per row.
+            cols (int, optional): The number of subplot columns. Defaults to 2.
+            xlabel (str, optional): The label for the x-axes. Defaults to "Time".
+            ylabel (str, optional): The label for the y-axes. Defaults to "Population".
+            save_path (Union[str, Path, None], optional): The path to save the figure image. Defaults to None.
+            show (Optional[bool], optional): Whether to show the figure in a window. Defaults to None, which
+                shows it only when it is not saved.
+            backend (Optional[str], optional): A matplotlib backend to switch to before showing the figure.
+                Defaults to None.
+        """
+        rows = math.ceil(len(specs) / cols)
+        fig, plt = _figure((8 * cols, 5 * rows), save_path, show, backend)
+        axes = fig.subplots(rows, cols, squeeze=False)
+        for ax, spec in zip(axes.flat, specs):
+            cls._draw(ax, *spec[:3])
+            if len(spec) > 3:
+                ax.set_title(spec[3])
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+        for ax in axes.flat[len(specs):]:
+            ax.set_visible(False)
+
+        fig.tight_layout()
+        _finish(plt, fig, save_path)
+
+    @staticmethod
+    def _draw(ax, xval: Iterable, data: Iterable, labels: List[str]):
+        """
+        Draws one line per series on the given axes.
+
+        Solver results hold one contiguous series per row, so each row is handed to
+        matplotlib as it is rather than transposing the array into columns.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to draw on.
+            xval (Iterable): The x-axis values shared by all series.
+            data (Iterable): The y-axis values, one series per row.
+            labels (List[str]): A label per series, or an empty list for no legend.
+        """
+        for idx, series in enumerate(np.atleast_2d(data)):
+            ax.plot(xval, series, label=labels[idx] if labels else None)
+        if labels:
+            ax.legend()
+
+
+def _figure(figsize: Tuple[float, float], save_path: Union[str, Path, None], show: Optional[bool], backend: Optional[str]):
+    """
+    Creates a figure, through pyplot only if it will be shown.
+
+    A figure that is not shown gets its own Agg canvas, which needs no GUI toolkit and leaves
+    pyplot's backend untouched. A shown figure uses pyplot, switching to `backend` if given,
+    else to the one named by `MPL_BACKEND`, else matplotlib's own choice (which honours `MPLBACKEND`).
+
+    Args:
+        figsize (Tuple[float, float]): The figure size in inches.
+        save_path (Union[str, Path, None]): Where the figure will be saved, if anywhere.
+        show (Optional[bool]): Whether the figure will be shown, or None to show it only when it is not saved.
+        backend (Optional[str]): The backend requested by the caller.
+
+    Returns:
+        Tuple[matplotlib.figure.Figure, Optional[module]]: The figure, and `matplotlib.pyplot` if the
+            figure will be shown or None otherwise.
+    """
+    if not (show if show is not None else not save_path):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, None
+
+    import matplotlib
+
+    backend = backend or os.environ.get("MPL_BACKEND")
+    if backend is not None:
+        matplotlib.use(backend)
+    import matplotlib.pyplot as plt
+
+    return plt.figure(figsize=figsize), plt
+
+
+def _finish(plt, fig, save_path: Union[str, Path, None]):
+    """
+    Saves a finished figure, then shows it if it was made through pyplot.
+
+    Args:
+        plt (Optional[module]): `matplotlib.pyplot`, or None for a figure that is only saved.
+        fig (matplotlib.figure.Figure): The figure.
+        save_path (Union[str, Path, None]): Where to save the figure, if anywhere.
+    """
+    if save_path:
+        fig.savefig(save_path)
+    if plt is not None:
         plt.show()
@@ -0,0 +1,20 @@
+"""
+Tests for the Delay model.
+"""
+
+import numpy as np
+import pytest
+
+from PopModels import Delay
+
+
+@pytest.mark.parametrize("method", ["FwdEuler", "ModEuler", "ImplicitEuler", "RK4"])
+def test_delay_shorter_than_half_a_step_is_rejected(method):
+    with pytest.raises(ValueError):
+        Delay(X0=0.8, r=12, T=0.01, K=3, method=method, tmin=0, tmax=1, h=0.05)
+
+
+def test_delay_of_one_step_is_deterministic():
+    runs = [Delay(X0=0.8, r=1, T=0.05, K=3, method="ModEuler", tmin=0, tmax=1, h=0.05).solve() for _ in range(2)]
+    assert np.all(np.isfinite(runs[0]))
+    np.testing.assert_array_equal(runs[0], runs[1])